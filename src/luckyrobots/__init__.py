@@ -11,6 +11,7 @@ from luckyrobots.models import FPS as FPS
 from luckyrobots.models import CameraFrame as CameraFrame
 from luckyrobots.models import ObservationResponse as ObservationResponse
 from luckyrobots.lucky_env import LuckyEnv as LuckyEnv
+from luckyrobots.sim_contract import DomainRandomizationConfig as DomainRandomizationConfig
 from luckyrobots.session import Session as Session
 from luckyrobots.robots import RobotController as RobotController
 from luckyrobots.robots import PolicySlotState as PolicySlotState
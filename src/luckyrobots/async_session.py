@@ -20,6 +20,9 @@ Notes:
   It uses a ``grpc.aio`` channel and the same generated ``*Stub`` classes
   (the generated stubs work with both sync and aio channels — only the
   channel type differs).
+- ``step`` and the ``stream_*`` methods let a single event loop drive
+  stepping alongside several camera / telemetry streams, without a
+  thread per stream.
 - This wrapper deliberately stays small: launch_luckyengine / domain
   helpers from the sync ``Session`` are not duplicated here. Pair with
   the sync ``Session`` if you need engine-launch lifecycle, or call
@@ -30,20 +33,28 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 import grpc.aio as grpc_aio
 
+from .client import DEFAULT_CHANNEL_OPTIONS, _as_action_list, _CameraFrameStream
 from .grpc.generated import (
     agent_pb2,
     agent_pb2_grpc,
+    camera_pb2,
+    camera_pb2_grpc,
+    common_pb2,
     debug_pb2_grpc,
+    mujoco_pb2,
     mujoco_pb2_grpc,
     mujoco_scene_pb2,
     mujoco_scene_pb2_grpc,
     scene_pb2,
     scene_pb2_grpc,
+    telemetry_pb2,
+    telemetry_pb2_grpc,
 )
+from .models import ObservationResponse
 from .robots.robot_controller import (
     PolicyDescriptorInfo,
     RobotControllerState,
@@ -71,6 +82,11 @@ class AsyncSession:
         self._mujoco: Optional[mujoco_pb2_grpc.MujocoServiceStub] = None
         self._mujoco_scene: Optional[mujoco_scene_pb2_grpc.MujocoSceneServiceStub] = None
         self._debug: Optional[debug_pb2_grpc.DebugServiceStub] = None
+        self._camera: Optional[camera_pb2_grpc.CameraServiceStub] = None
+        self._telemetry: Optional[telemetry_pb2_grpc.TelemetryServiceStub] = None
+
+        # Cached agent schemas: agent_name -> (observation_names, action_names)
+        self._schema_cache: dict[str, tuple[list[str], list[str]]] = {}
 
     # ---- lifecycle ----
 
@@ -81,7 +97,7 @@ class AsyncSession:
 
         target = f"{self.host}:{self.port}"
         logger.info("AsyncSession connecting to %s", target)
-        channel = grpc_aio.insecure_channel(target)
+        channel = grpc_aio.insecure_channel(target, options=DEFAULT_CHANNEL_OPTIONS)
 
         try:
             await asyncio.wait_for(channel.channel_ready(), timeout=timeout_s)
@@ -97,6 +113,8 @@ class AsyncSession:
         self._mujoco = mujoco_pb2_grpc.MujocoServiceStub(channel)
         self._mujoco_scene = mujoco_scene_pb2_grpc.MujocoSceneServiceStub(channel)
         self._debug = debug_pb2_grpc.DebugServiceStub(channel)
+        self._camera = camera_pb2_grpc.CameraServiceStub(channel)
+        self._telemetry = telemetry_pb2_grpc.TelemetryServiceStub(channel)
         logger.info("AsyncSession connected to %s", target)
 
     async def close(self) -> None:
@@ -110,6 +128,8 @@ class AsyncSession:
         self._mujoco = None
         self._mujoco_scene = None
         self._debug = None
+        self._camera = None
+        self._telemetry = None
         try:
             await ch.close()
         except Exception:
@@ -166,6 +186,120 @@ class AsyncSession:
         self._require_channel()
         return self._debug  # type: ignore[return-value]
 
+    @property
+    def camera(self) -> camera_pb2_grpc.CameraServiceStub:
+        self._require_channel()
+        return self._camera  # type: ignore[return-value]
+
+    @property
+    def telemetry(self) -> telemetry_pb2_grpc.TelemetryServiceStub:
+        self._require_channel()
+        return self._telemetry  # type: ignore[return-value]
+
+    # ---- RL stepping (mirror LuckyEngineClient.get_agent_schema / step) ----
+
+    async def get_agent_schema(self, agent_name: str = "", timeout: Optional[float] = None):
+        """Fetch the agent schema and cache its names for named access in step()."""
+        resp = await self.agent.GetAgentSchema(
+            agent_pb2.GetAgentSchemaRequest(agent_name=agent_name),
+            timeout=timeout,
+        )
+        schema = resp.schema
+        self._schema_cache[agent_name or "agent_0"] = (
+            list(schema.observation_names),
+            list(schema.action_names),
+        )
+        return resp
+
+    async def step(
+        self,
+        actions: Optional[Sequence[float]] = None,
+        agent_name: str = "",
+        step_timeout_s: float = 0.0,
+        timeout: Optional[float] = None,
+    ) -> ObservationResponse:
+        """Apply actions, wait for the physics step, and return the observation.
+
+        Raises:
+            RuntimeError: If the server reports the physics step timed out.
+        """
+        resp = await self.agent.Step(
+            agent_pb2.StepRequest(
+                agent_name=agent_name,
+                actions=_as_action_list(actions),
+                timeout_s=step_timeout_s,
+            ),
+            timeout=timeout,
+        )
+        if not resp.success:
+            raise RuntimeError(f"Server-side physics timeout: {resp.message}")
+
+        cache_key = agent_name or "agent_0"
+        obs_names, action_names = self._schema_cache.get(cache_key, (None, None))
+        return ObservationResponse.from_proto(
+            resp,
+            agent_name=cache_key,
+            observation_names=obs_names,
+            action_names=action_names,
+        )
+
+    # ---- streaming (async iterables; several can run on one event loop) ----
+
+    def stream_camera(
+        self,
+        name: Optional[str] = None,
+        entity_id: Optional[int] = None,
+        target_fps: int = 30,
+        width: int = 0,
+        height: int = 0,
+        format: str = "raw",
+        as_camera_frames: bool = False,
+    ):
+        """Async-iterate server-streamed ``ImageFrame`` protos for a camera.
+
+        With ``as_camera_frames=True`` each frame is yielded as a
+        :class:`CameraFrame` instead (see ``LuckyEngineClient.stream_camera``);
+        ``cancel()`` still reaches the underlying call.
+
+        Example:
+            async for frame in sess.stream_camera(name="HeadCam"):
+                ...
+        """
+        if (name is None) == (entity_id is None):
+            raise ValueError("Pass exactly one of `name` or `entity_id`.")
+        if entity_id is not None:
+            req = camera_pb2.StreamCameraRequest(
+                id=common_pb2.EntityId(id=entity_id),
+                target_fps=target_fps,
+                width=width,
+                height=height,
+                format=format,
+            )
+        else:
+            req = camera_pb2.StreamCameraRequest(
+                name=name,
+                target_fps=target_fps,
+                width=width,
+                height=height,
+                format=format,
+            )
+        stream = self.camera.StreamCamera(req)
+        if as_camera_frames:
+            return _CameraFrameStream(stream, name if name is not None else str(entity_id))
+        return stream
+
+    def stream_telemetry(self, target_fps: int = 30):
+        """Async-iterate server-streamed ``TelemetryFrame`` protos."""
+        return self.telemetry.StreamTelemetry(
+            telemetry_pb2.StreamTelemetryRequest(target_fps=target_fps)
+        )
+
+    def stream_joint_state(self, robot_name: str = ""):
+        """Async-iterate server-streamed agent-scoped joint state."""
+        return self.mujoco.StreamJointState(
+            mujoco_pb2.GetJointStateRequest(robot_name=robot_name)
+        )
+
     # ---- convenience awaitables (mirror Session.list_robot_controllers etc.) ----
 
     async def list_robot_controllers(self) -> List[RobotControllerState]:
@@ -10,14 +10,33 @@ from __future__ import annotations
 import logging
 import math
 import statistics
+import threading
 import time
 from types import SimpleNamespace
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 import grpc  # type: ignore
 
 logger = logging.getLogger("luckyrobots.client")
 
+# Channel options applied unless the caller overrides them. gRPC's default
+# 4 MB receive cap is smaller than a single raw 1080p RGBA camera frame, and
+# keepalive pings let long-lived streams notice a dead engine promptly. Pings
+# are only sent while calls are active so idle clients don't trip the server's
+# ping-strike policy.
+DEFAULT_CHANNEL_OPTIONS: tuple[tuple[str, Any], ...] = (
+    ("grpc.max_receive_message_length", 64 * 1024 * 1024),
+    ("grpc.max_send_message_length", 16 * 1024 * 1024),
+    ("grpc.keepalive_time_ms", 30_000),
+    ("grpc.keepalive_timeout_ms", 10_000),
+    ("grpc.keepalive_permit_without_calls", 0),
+)
+
+# Process-wide channels for clients created with ``shared_channel=True``:
+# (target, options, compression) -> [channel, refcount].
+_SHARED_CHANNELS: dict[tuple, list] = {}
+_SHARED_CHANNELS_LOCK = threading.Lock()
+
 try:
     from .grpc.generated import agent_pb2  # type: ignore
     from .grpc.generated import agent_pb2_grpc  # type: ignore
@@ -43,12 +62,53 @@ except Exception as e:  # pragma: no cover
         "src/luckyrobots/grpc/proto into src/luckyrobots/grpc/generated."
     ) from e
 
-from .models import ObservationResponse
-from .models.observation import CameraFrame
+from .models import CameraFrame, ObservationResponse
 from .models.benchmark import BenchmarkResult
 from . import sim_contract
 
 
+def _as_action_list(actions: Sequence[float] | None) -> list[float]:
+    """Normalise a step() action vector to the list a StepRequest expects.
+
+    NumPy arrays convert in one C-level pass; ``actions or []`` would raise on
+    them.
+    """
+    if actions is None:
+        return []
+    if isinstance(actions, list):
+        return actions
+    return actions.tolist() if hasattr(actions, "tolist") else list(actions)
+
+
+class _CameraFrameStream:
+    """Server-streaming camera call that yields :class:`CameraFrame` objects.
+
+    Works over both sync and ``grpc.aio`` calls. Everything else (``cancel()``,
+    ``is_active()``, ``code()``, ...) is forwarded to the underlying call, so an
+    infinite stream can still be stopped explicitly.
+    """
+
+    def __init__(self, call: Any, name: str) -> None:
+        self._call = call
+        self._name = name
+
+    def __iter__(self) -> "_CameraFrameStream":
+        return self
+
+    def __next__(self) -> CameraFrame:
+        return CameraFrame.from_proto(next(self._call), self._name)
+
+    async def __aiter__(self):
+        async for frame in self._call:
+            yield CameraFrame.from_proto(frame, self._name)
+
+    def cancel(self) -> bool:
+        return self._call.cancel()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._call, name)
+
+
 class GrpcConnectionError(Exception):
     """Raised when gRPC connection fails."""
 
@@ -84,6 +144,9 @@ class LuckyEngineClient:
         timeout: float = 5.0,
         *,
         robot_name: Optional[str] = None,
+        channel_options: Optional[Sequence[tuple[str, Any]]] = None,
+        compression: Optional[grpc.Compression] = None,
+        shared_channel: bool = False,
     ) -> None:
         """
         Initialize the LuckyEngine gRPC client.
@@ -93,11 +156,30 @@ class LuckyEngineClient:
             port: gRPC server port.
             timeout: Default timeout for RPC calls in seconds.
             robot_name: Default robot name for calls that require it.
+            channel_options: Extra gRPC channel options, merged over
+                ``DEFAULT_CHANNEL_OPTIONS`` (same key = caller wins).
+            compression: Channel-wide compression (e.g. ``grpc.Compression.Gzip``).
+                Off by default: on a local link raw frames are cheaper to send
+                than to compress.
+            shared_channel: Reuse one process-wide channel (one TCP connection)
+                across all clients with the same target and channel settings.
+                The channel is closed when the last client sharing it closes.
         """
         self.host = host
         self.port = port
         self.timeout = timeout
         self._robot_name = robot_name
+        self._channel_options = list(
+            dict([*DEFAULT_CHANNEL_OPTIONS, *(channel_options or ())]).items()
+        )
+        self._compression = compression
+        self._shared_channel_key: Optional[tuple] = None
+        if shared_channel:
+            self._shared_channel_key = (
+                f"{host}:{port}",
+                tuple(self._channel_options),
+                compression,
+            )
 
         self._channel = None
 
@@ -120,6 +202,13 @@ class LuckyEngineClient:
         # Camera requests included on every Step RPC (configured via configure_cameras).
         self._camera_requests: list = []
 
+        # Immutable request messages for polled RPCs against the default robot.
+        # They are never mutated after construction, so sharing them across
+        # calls (and threads) is safe and skips per-call message allocation.
+        # Only one per RPC is kept, so other robot names cannot grow the cache.
+        self._joint_state_request_cached: Any = None
+        self._mujoco_info_request_cached: Any = None
+
         # Protobuf modules (for discoverability + explicit imports).
         self._pb = SimpleNamespace(
             common=common_pb2,
@@ -134,6 +223,10 @@ class LuckyEngineClient:
             media=media_pb2,
         )
 
+        # Request class for the per-step hot path, bound once so step() skips
+        # the pb property -> namespace -> module attribute chain.
+        self._step_request_cls = self._pb.agent.StepRequest
+
     def connect(self) -> None:
         """
         Connect to the LuckyEngine gRPC server.
@@ -144,10 +237,16 @@ class LuckyEngineClient:
         Raises:
             GrpcConnectionError: If connection fails.
         """
+        if self._channel is not None:
+            self.close()
+
         target = f"{self.host}:{self.port}"
         logger.info(f"Connecting to LuckyEngine gRPC server at {target}")
 
-        self._channel = grpc.insecure_channel(target)
+        if self._shared_channel_key is not None:
+            self._channel = self._acquire_shared_channel()
+        else:
+            self._channel = self._open_channel()
 
         # Drop any cached stubs so a reconnect re-binds them to the new channel.
         self._scene = None
@@ -163,12 +262,17 @@ class LuckyEngineClient:
         logger.info(f"Channel opened to {target} (server not verified yet)")
 
     def close(self) -> None:
-        """Close the gRPC channel."""
+        """Close the gRPC channel.
+
+        For a shared channel this drops this client's reference; the channel
+        itself is closed once no other client is using it.
+        """
         if self._channel is not None:
-            try:
-                self._channel.close()
-            except Exception as e:
-                logger.debug(f"Error closing gRPC channel: {e}")
+            if self._shared_channel_key is None or self._release_shared_channel():
+                try:
+                    self._channel.close()
+                except Exception as e:
+                    logger.debug(f"Error closing gRPC channel: {e}")
             self._channel = None
             self._scene = None
             self._mujoco = None
@@ -176,9 +280,43 @@ class LuckyEngineClient:
             self._agent = None
             self._camera = None
             self._debug = None
+            self._telemetry = None
+            self._viewport = None
             self._extra_stubs = {}
             logger.info("gRPC channel closed")
 
+    def _open_channel(self) -> grpc.Channel:
+        """Create a new channel to this client's target."""
+        return grpc.insecure_channel(
+            f"{self.host}:{self.port}",
+            options=self._channel_options,
+            compression=self._compression,
+        )
+
+    def _acquire_shared_channel(self) -> grpc.Channel:
+        """Return the process-wide channel for this client's settings, +1 ref."""
+        key = self._shared_channel_key
+        with _SHARED_CHANNELS_LOCK:
+            entry = _SHARED_CHANNELS.get(key)
+            if entry is None:
+                entry = [self._open_channel(), 0]
+                _SHARED_CHANNELS[key] = entry
+            entry[1] += 1
+            return entry[0]
+
+    def _release_shared_channel(self) -> bool:
+        """Drop one ref to the shared channel; True if the caller should close it."""
+        key = self._shared_channel_key
+        with _SHARED_CHANNELS_LOCK:
+            entry = _SHARED_CHANNELS.get(key)
+            if entry is None or entry[0] is not self._channel:
+                return False
+            entry[1] -= 1
+            if entry[1] > 0:
+                return False
+            del _SHARED_CHANNELS[key]
+            return True
+
     def is_connected(self) -> bool:
         """Check if the client is connected."""
         return self._channel is not None
@@ -198,8 +336,8 @@ class LuckyEngineClient:
 
         timeout = timeout or self.timeout
         try:
-            self._mujoco.GetMujocoInfo(
-                self.pb.mujoco.GetMujocoInfoRequest(robot_name=self._robot_name or ""),
+            self.mujoco.GetMujocoInfo(
+                self._mujoco_info_request(self._robot_name or ""),
                 timeout=timeout,
             )
             return True
@@ -220,22 +358,40 @@ class LuckyEngineClient:
         Returns:
             True if server became available, False if timeout.
         """
-        start = time.perf_counter()
+        deadline = time.perf_counter() + timeout
+
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return False
 
-        while time.perf_counter() - start < timeout:
             if not self.is_connected():
                 try:
                     self.connect()
                 except Exception:
                     pass
 
-            if self.health_check(timeout=min(poll_interval, timeout - (time.perf_counter() - start))):
-                logger.info(f"Connected to LuckyEngine gRPC server at {self.host}:{self.port}")
-                return True
+            if self.is_connected():
+                # Block on the channel's connectivity state instead of
+                # sleep-polling: this returns as soon as the TCP/HTTP2
+                # handshake completes while the engine is still starting up.
+                ready = grpc.channel_ready_future(self._channel)
+                try:
+                    ready.result(timeout=min(poll_interval, remaining))
+                except grpc.FutureTimeoutError:
+                    # Drops the future's connectivity subscription on the channel.
+                    ready.cancel()
+                    continue
 
-            time.sleep(poll_interval)
+                # health_check() treats a zero timeout as "use the default".
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    return False
+                if self.health_check(timeout=min(poll_interval, remaining)):
+                    logger.info(f"Connected to LuckyEngine gRPC server at {self.host}:{self.port}")
+                    return True
 
-        return False
+            time.sleep(max(0.0, min(poll_interval, deadline - time.perf_counter())))
 
     @property
     def pb(self) -> Any:
@@ -470,25 +626,48 @@ class LuckyEngineClient:
             state.velocities (qvel).
         """
         timeout = timeout or self.timeout
-        robot_name = robot_name or self._robot_name
-        if not robot_name:
-            raise ValueError("robot_name is required")
+        robot_name = self._resolve_robot_name(robot_name)
         return self.mujoco.GetJointState(
-            self.pb.mujoco.GetJointStateRequest(robot_name=robot_name),
+            self._joint_state_request(robot_name),
             timeout=timeout,
         )
 
     def get_mujoco_info(self, robot_name: str = "", timeout: Optional[float] = None):
         """Get MuJoCo model information (joint names, limits, etc.)."""
         timeout = timeout or self.timeout
-        robot_name = robot_name or self._robot_name
-        if not robot_name:
-            raise ValueError("robot_name is required")
+        robot_name = self._resolve_robot_name(robot_name)
         return self.mujoco.GetMujocoInfo(
-            self.pb.mujoco.GetMujocoInfoRequest(robot_name=robot_name),
+            self._mujoco_info_request(robot_name),
             timeout=timeout,
         )
 
+    def _resolve_robot_name(self, robot_name: str) -> str:
+        """Return ``robot_name`` or the client default, raising if neither is set."""
+        robot_name = robot_name or self._robot_name
+        if not robot_name:
+            raise ValueError("robot_name is required")
+        return robot_name
+
+    def _joint_state_request(self, robot_name: str):
+        """Return a GetJointStateRequest, shared when it targets the default robot."""
+        req = self._joint_state_request_cached
+        if req is not None and req.robot_name == robot_name:
+            return req
+        req = self.pb.mujoco.GetJointStateRequest(robot_name=robot_name)
+        if robot_name == (self._robot_name or ""):
+            self._joint_state_request_cached = req
+        return req
+
+    def _mujoco_info_request(self, robot_name: str):
+        """Return a GetMujocoInfoRequest, shared when it targets the default robot."""
+        req = self._mujoco_info_request_cached
+        if req is not None and req.robot_name == robot_name:
+            return req
+        req = self.pb.mujoco.GetMujocoInfoRequest(robot_name=robot_name)
+        if robot_name == (self._robot_name or ""):
+            self._mujoco_info_request_cached = req
+        return req
+
     # ── MujocoSceneService RPCs (engine-wide, not agent-scoped) ──
 
     def get_model_info(self, timeout: Optional[float] = None):
@@ -684,7 +863,9 @@ class LuckyEngineClient:
 
         Args:
             agent_name: Agent logical name. Empty string means default agent.
-            randomization_cfg: Optional simulation contract config for this reset.
+            randomization_cfg: Optional simulation contract config for this reset:
+                a ``DomainRandomizationConfig``, a mapping, or any object with
+                the same attribute names.
             timeout: Timeout in seconds (uses default if None).
 
         Returns:
@@ -705,7 +886,7 @@ class LuckyEngineClient:
 
     def step(
         self,
-        actions: list[float] | None = None,
+        actions: Sequence[float] | None = None,
         agent_name: str = "",
         step_timeout_s: float = 0.0,
         timeout: Optional[float] = None,
@@ -716,6 +897,7 @@ class LuckyEngineClient:
 
         Args:
             actions: Action vector to apply for this step (optional when using action_groups).
+                Lists are passed through as-is; NumPy arrays are accepted too.
             agent_name: Agent name (empty = default agent).
             step_timeout_s: Server-side timeout for waiting for the physics step (seconds).
                 0 means use server default.
@@ -729,8 +911,15 @@ class LuckyEngineClient:
         """
         timeout = timeout or self.timeout
 
-        # Build inline action groups if provided
-        proto_groups = []
+        request = self._step_request_cls(
+            agent_name=agent_name,
+            actions=_as_action_list(actions),
+            timeout_s=step_timeout_s,
+        )
+        if self._camera_requests:
+            request.camera_requests.extend(self._camera_requests)
+
+        # Build inline action groups directly into the request if provided
         if action_groups:
             for g in action_groups:
                 gname = g.get("group_name", "")
@@ -742,25 +931,14 @@ class LuckyEngineClient:
                         g,
                     )
                     continue
-                proto_groups.append(
-                    self.pb.agent.ActionGroupEntry(
-                        group_name=gname,
-                        actions=gactions,
-                        action_indices=gindices,
-                    )
+                request.action_groups.add(
+                    group_name=gname,
+                    actions=gactions,
+                    action_indices=gindices,
                 )
 
         try:
-            resp = self.agent.Step(
-                self.pb.agent.StepRequest(
-                    agent_name=agent_name,
-                    actions=actions or [],
-                    timeout_s=step_timeout_s,
-                    camera_requests=self._camera_requests,
-                    action_groups=proto_groups,
-                ),
-                timeout=timeout,
-            )
+            resp = self.agent.Step(request, timeout=timeout)
         except grpc.RpcError as e:
             if e.code() == grpc.StatusCode.DEADLINE_EXCEEDED:
                 raise RuntimeError(
@@ -775,48 +953,14 @@ class LuckyEngineClient:
                 f"(server waited up to its configured timeout for the physics step to complete)"
             )
 
-        agent_frame = resp.observation
-        observations = list(agent_frame.observations) if agent_frame.observations else []
-        actions_out = list(agent_frame.actions) if agent_frame.actions else []
-        timestamp_ms = getattr(agent_frame, "timestamp_ms", 0)
-        frame_number = getattr(agent_frame, "frame_number", 0)
-
         cache_key = agent_name or "agent_0"
         obs_names, action_names = self._schema_cache.get(cache_key, (None, None))
 
-        camera_frames = [
-            CameraFrame(
-                name=nf.name,
-                data=bytes(nf.frame.data),
-                width=nf.frame.width,
-                height=nf.frame.height,
-                channels=nf.frame.channels,
-                frame_number=nf.frame.frame_number,
-            )
-            for nf in resp.camera_frames
-        ]
-
-        # Extract enriched step data if present
-        reward_signals = dict(resp.reward_signals) if resp.reward_signals else None
-        terminated = resp.terminated
-        truncated = resp.truncated
-        info = dict(resp.info) if resp.info else None
-        termination_flags = dict(resp.termination_flags) if resp.termination_flags else None
-
-        return ObservationResponse(
-            observation=observations,
-            actions=actions_out,
-            timestamp_ms=timestamp_ms,
-            frame_number=frame_number,
+        return ObservationResponse.from_proto(
+            resp,
             agent_name=cache_key,
             observation_names=obs_names,
             action_names=action_names,
-            camera_frames=camera_frames,
-            reward_signals=reward_signals,
-            terminated=terminated,
-            truncated=truncated,
-            info=info,
-            termination_flags=termination_flags,
         )
 
     # ── Progress reporting ──
@@ -1456,12 +1600,18 @@ class LuckyEngineClient:
         width: int = 0,
         height: int = 0,
         format: str = "raw",
+        as_camera_frames: bool = False,
     ):
         """Iterate over server-streamed :class:`ImageFrame` protos for a camera.
 
         Identify by name (camera entity tag) or by numeric entity id. For
         synchronous in-step capture use :meth:`configure_cameras` plus
         :meth:`step` instead.
+
+        With ``as_camera_frames=True`` each frame is yielded as a
+        :class:`CameraFrame` instead, whose ``image`` is a zero-copy
+        ``(H, W, C)`` uint8 view (raw format only). The returned stream still
+        supports ``cancel()`` and the other call methods.
         """
         if (name is None) == (entity_id is None):
             raise ValueError("Pass exactly one of `name` or `entity_id`.")
@@ -1481,7 +1631,10 @@ class LuckyEngineClient:
                 height=height,
                 format=format,
             )
-        return self.camera.StreamCamera(req)
+        stream = self.camera.StreamCamera(req)
+        if as_camera_frames:
+            return _CameraFrameStream(stream, name if name is not None else str(entity_id))
+        return stream
 
     # ── MujocoService streaming ──
 
@@ -1496,9 +1649,7 @@ class LuckyEngineClient:
         streaming use :meth:`stream_full_state` on the MujocoScene wrapper.
         """
         robot = robot_name if robot_name is not None else (self._robot_name or "")
-        return self.mujoco.StreamJointState(
-            self.pb.mujoco.GetJointStateRequest(robot_name=robot),
-        )
+        return self.mujoco.StreamJointState(self._joint_state_request(robot))
 
     # ── Benchmarking ──
 
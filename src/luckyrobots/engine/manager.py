@@ -11,12 +11,36 @@ import subprocess
 import tempfile
 import threading
 import time
-from typing import Optional
+from typing import Any, Optional
+
+try:
+    import fcntl
+
+    _HAS_FCNTL = True
+except ImportError:  # Windows
+    _HAS_FCNTL = False
 
 logger = logging.getLogger("luckyrobots.luckyengine")
 
 LOCK_FILE = os.path.join(tempfile.gettempdir(), "luckyengine_lock")
 
+# Descriptor holding the exclusive flock on LOCK_FILE while this process's
+# engine is alive (POSIX only). The engine inherits it, so the lock outlives
+# the Python launcher for as long as the engine runs.
+_lock_fd: Optional[int] = None
+
+# psutil handles for engine PIDs already verified from the lock file, reused
+# across is_running() polls.
+_engine_procs: dict[int, Any] = {}
+
+# Linux equivalent of _engine_procs: verified engine PID -> /proc starttime.
+_engine_start_times: dict[int, bytes] = {}
+
+# The host OS can't change during a process lifetime; resolve it once.
+_SYSTEM = platform.system()
+_IS_WSL = "microsoft" in platform.uname().release.lower()
+_IS_LINUX = _SYSTEM == "Linux"
+
 
 # ============================================================================
 # EngineProcess — class-based lifecycle manager
@@ -36,8 +60,32 @@ class EngineProcess:
         self._shutdown_event = threading.Event()
 
     def is_running(self) -> bool:
-        """Check if LuckyEngine is currently running."""
-        return os.path.exists(LOCK_FILE)
+        """Check if LuckyEngine is currently running.
+
+        On POSIX the launcher holds an flock on the lock file that the
+        engine inherits, so a held lock means running without inspecting any
+        process. Otherwise the lock file is only trusted while the PID it
+        records is alive and still a LuckyEngine process. A stale lock (e.g.
+        left behind by a crash, or pointing at a reused PID) is removed.
+        """
+        if self._process is not None and self._process.poll() is None:
+            return True
+
+        if not os.path.exists(LOCK_FILE):
+            return False
+        if _lock_file_is_held():
+            return True
+
+        pid = _read_lock_file()
+        if pid is None:
+            # Unreadable or mid-write; trust the file as before.
+            return True
+        if _is_engine_pid(pid):
+            return True
+
+        logger.info(f"Removing stale LuckyEngine lock file (PID {pid} is not running)")
+        _remove_lock_file()
+        return False
 
     def get_stderr(self) -> Optional[str]:
         """Get stderr output from the engine process (if captured)."""
@@ -98,12 +146,16 @@ class EngineProcess:
                 logger.info("  LUCKYENGINE_HOME=/path/to/luckyengine/directory")
                 return False
 
-        if not os.path.exists(executable_path):
+        try:
+            st = os.stat(executable_path)
+        except OSError:
             logger.error(f"Executable not found at: {executable_path}")
             return False
 
         try:
-            if platform.system() != "Windows":
+            # One stat covers both the existence check and the mode check;
+            # chmod only when a previous launch hasn't already fixed it up.
+            if _SYSTEM != "Windows" and (st.st_mode & 0o777) != 0o755:
                 os.chmod(executable_path, 0o755)
 
             logger.info(f"Launching LuckyEngine: {executable_path}")
@@ -134,7 +186,7 @@ class EngineProcess:
             # Use LuckyEditor/ as working directory so shader/resource paths resolve
             cwd = editor_dir if os.path.isdir(editor_dir) else None
 
-            if platform.system() == "Windows":
+            if _SYSTEM == "Windows":
                 DETACHED_PROCESS = 0x00000008
                 self._process = subprocess.Popen(
                     command,
@@ -145,10 +197,17 @@ class EngineProcess:
                     stderr=None if verbose else subprocess.PIPE,
                 )
             else:
+                try:
+                    lock_fd = _acquire_lock_file()
+                except RuntimeError as e:
+                    # Lost a race with another launcher; leave its lock alone.
+                    logger.error(str(e))
+                    return False
                 self._process = subprocess.Popen(
                     command,
                     cwd=cwd,
                     start_new_session=True,
+                    pass_fds=() if lock_fd is None else (lock_fd,),
                     stdout=None if verbose else subprocess.DEVNULL,
                     stderr=None if verbose else subprocess.PIPE,
                 )
@@ -181,6 +240,12 @@ class EngineProcess:
             logger.info("LuckyEngine is not running")
             return True
 
+        if self._process is None and _lock_fd is None and _lock_file_is_held():
+            # Another launcher owns the engine and its lock; removing the lock
+            # here would hide a live engine from is_running().
+            logger.info("LuckyEngine was launched by another process; leaving it running")
+            return False
+
         try:
             if self._process:
                 logger.info("Stopping LuckyEngine...")
@@ -243,8 +308,6 @@ def find_luckyengine_executable() -> Optional[str]:
     Returns:
         Path to executable if found, None otherwise.
     """
-    is_wsl = "microsoft" in platform.uname().release.lower()
-
     env_path = os.environ.get("LUCKYENGINE_PATH")
     if env_path:
         logger.info(f"Using LUCKYENGINE_PATH environment variable: {env_path}")
@@ -255,12 +318,12 @@ def find_luckyengine_executable() -> Optional[str]:
     env_home = os.environ.get("LUCKYENGINE_HOME")
     if env_home:
         logger.info(f"Using LUCKYENGINE_HOME environment variable: {env_home}")
-        executable = _get_executable_for_platform(env_home, "LuckyEngine", is_wsl)
+        executable = _get_executable_for_platform(env_home, "LuckyEngine", _IS_WSL)
         if executable and os.path.exists(executable):
             return executable
         logger.warning(f"LUCKYENGINE_HOME does not contain executable: {executable}")
 
-    system_paths = _get_system_paths(is_wsl)
+    system_paths = _get_system_paths(_IS_WSL)
     for path in system_paths:
         if os.path.exists(path):
             logger.info(f"Found LuckyEngine at: {path}")
@@ -278,9 +341,9 @@ def _get_executable_for_platform(
     home_dir: str, base_name: str, is_wsl: bool
 ) -> Optional[str]:
     """Get the executable path for the current platform."""
-    if platform.system() == "Linux" and not is_wsl:
+    if _SYSTEM == "Linux" and not is_wsl:
         return os.path.join(home_dir, f"{base_name}.sh")
-    elif platform.system() == "Darwin":
+    elif _SYSTEM == "Darwin":
         return os.path.join(
             home_dir, f"{base_name}.app", "Contents", "MacOS", base_name
         )
@@ -292,7 +355,7 @@ def _get_system_paths(is_wsl: bool) -> list[str]:
     """Get system installation paths for the current platform."""
     paths = []
 
-    if platform.system() == "Linux" and not is_wsl:
+    if _SYSTEM == "Linux" and not is_wsl:
         paths.extend(
             [
                 "/opt/LuckyEngine/LuckyEngine.sh",
@@ -301,7 +364,7 @@ def _get_system_paths(is_wsl: bool) -> list[str]:
                 os.path.expanduser("~/LuckyEngine/LuckyEngine.sh"),
             ]
         )
-    elif platform.system() == "Darwin":
+    elif _SYSTEM == "Darwin":
         paths.extend(
             [
                 "/Applications/LuckyEngine/LuckyEngine.app/Contents/MacOS/LuckyEngine",
@@ -330,14 +393,170 @@ def _get_system_paths(is_wsl: bool) -> list[str]:
     return paths
 
 
+def _acquire_lock_file() -> Optional[int]:
+    """Open LOCK_FILE and take an exclusive, non-blocking flock on it.
+
+    Returns:
+        The locked descriptor, or None where flock is unavailable (Windows).
+
+    Raises:
+        RuntimeError: If another launcher already holds the lock.
+    """
+    global _lock_fd
+
+    if not _HAS_FCNTL:
+        return None
+    if _lock_fd is not None:
+        return _lock_fd
+
+    fd = os.open(LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        raise RuntimeError(f"LuckyEngine lock is held by another process: {LOCK_FILE}")
+    _lock_fd = fd
+    return fd
+
+
+def _lock_file_is_held() -> bool:
+    """Check whether some process holds the flock on LOCK_FILE (POSIX only)."""
+    if not _HAS_FCNTL:
+        return False
+    try:
+        fd = os.open(LOCK_FILE, os.O_RDONLY)
+    except OSError:
+        return False
+    try:
+        fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return True
+    finally:
+        # Closing also drops the probe lock if we did acquire it.
+        os.close(fd)
+    return False
+
+
 def _create_lock_file(pid: int) -> None:
     """Create a lock file with the process ID."""
+    if _lock_fd is not None:
+        os.ftruncate(_lock_fd, 0)
+        os.pwrite(_lock_fd, str(pid).encode(), 0)
+        return
     with open(LOCK_FILE, "w") as f:
         f.write(str(pid))
 
 
+def _read_lock_file() -> Optional[int]:
+    """Return the PID recorded in the lock file, or None if it can't be read."""
+    try:
+        with open(LOCK_FILE) as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def _is_engine_pid(pid: int) -> bool:
+    """Check that ``pid`` is alive and belongs to a LuckyEngine process."""
+    if _IS_LINUX:
+        return _is_engine_pid_procfs(pid)
+
+    # Imported here: only this non-Linux path needs psutil, and it adds ~20ms
+    # to ``import luckyrobots`` otherwise.
+    import psutil
+
+    proc = _engine_procs.get(pid)
+    if proc is not None:
+        # psutil.Process.is_running() compares create times, so a cached
+        # handle also detects PID reuse without re-reading name/argv.
+        if proc.is_running():
+            return True
+        del _engine_procs[pid]
+        return False
+
+    try:
+        proc = psutil.Process(pid)
+        with proc.oneshot():
+            # Launch wrappers (e.g. LuckyEngine.sh under a shell) keep the
+            # executable path in argv rather than the process name.
+            is_engine = "luckyengine" in proc.name().lower() or any(
+                "LuckyEngine" in arg for arg in proc.cmdline()
+            )
+    except psutil.NoSuchProcess:
+        return False
+    except psutil.AccessDenied:
+        # Alive but not inspectable (another user's process): assume it's ours.
+        return True
+
+    if is_engine:
+        _engine_procs[pid] = proc
+    return is_engine
+
+
+def _read_proc_file(path: str) -> bytes:
+    """Read a small /proc file with raw fd calls, skipping ``open()``'s buffering layer."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        while chunk := os.read(fd, 4096):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+
+def _proc_start_time(pid: int) -> Optional[bytes]:
+    """Return the starttime field of ``/proc/<pid>/stat``, or None if not alive."""
+    try:
+        stat = _read_proc_file(f"/proc/{pid}/stat")
+    except OSError:
+        return None
+    # comm (field 2) may contain spaces or parens; later fields follow the
+    # last ')'. fields[0] is the state (field 3), fields[19] starttime (22).
+    fields = stat[stat.rindex(b")") + 2 :].split()
+    if fields[0] == b"Z":
+        return None
+    return fields[19]
+
+
+def _is_engine_pid_procfs(pid: int) -> bool:
+    """Linux fast path for :func:`_is_engine_pid` using direct /proc reads."""
+    start_time = _proc_start_time(pid)
+    if start_time is None:
+        _engine_start_times.pop(pid, None)
+        return False
+    cached = _engine_start_times.get(pid)
+    if cached is not None:
+        if cached == start_time:
+            return True
+        # Same PID, different process: it was reused.
+        del _engine_start_times[pid]
+
+    try:
+        is_engine = b"luckyengine" in _read_proc_file(f"/proc/{pid}/comm").lower()
+        if not is_engine:
+            # Launch wrappers keep the executable path in argv instead.
+            is_engine = b"LuckyEngine" in _read_proc_file(f"/proc/{pid}/cmdline")
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+
+    if is_engine:
+        _engine_start_times[pid] = start_time
+    return is_engine
+
+
 def _remove_lock_file() -> None:
-    """Remove the lock file."""
+    """Remove the lock file and release this process's flock on it."""
+    global _lock_fd
+
+    if _lock_fd is not None:
+        try:
+            os.close(_lock_fd)
+        except OSError:
+            pass
+        _lock_fd = None
     try:
         if os.path.exists(LOCK_FILE):
             os.remove(LOCK_FILE)
@@ -350,45 +569,24 @@ def _remove_lock_file() -> None:
 
 def _kill_processes() -> None:
     """Kill all LuckyEngine processes."""
-    system = platform.system()
-    is_wsl = "microsoft" in platform.uname().release.lower()
-
-    if is_wsl:
-        _kill_wsl_processes()
-    elif system == "Windows":
-        _kill_windows_processes()
+    if _IS_WSL:
+        _kill_windows_processes("/mnt/c/Windows/System32/taskkill.exe")
+    elif _SYSTEM == "Windows":
+        _kill_windows_processes("taskkill")
     else:
         # macOS and Linux use identical pkill logic
         _kill_unix_processes()
 
 
-def _kill_wsl_processes() -> None:
-    """Kill LuckyEngine processes on WSL."""
-    try:
-        result = subprocess.run(
-            [
-                "/mnt/c/Windows/System32/taskkill.exe",
-                "/F",
-                "/IM",
-                "LuckyEngine.exe",
-            ],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if result.returncode == 0:
-            logger.info("Killed LuckyEngine.exe processes")
-        elif result.returncode == 128:  # Process not found
-            logger.debug("No LuckyEngine processes found running")
-    except Exception as e:
-        logger.debug(f"Error killing WSL processes: {e}")
-
+def _kill_windows_processes(taskkill: str) -> None:
+    """Kill LuckyEngine processes on Windows or WSL via ``taskkill``.
 
-def _kill_windows_processes() -> None:
-    """Kill LuckyEngine processes on Windows."""
+    Args:
+        taskkill: taskkill executable (the Windows-side path under WSL).
+    """
     try:
         result = subprocess.run(
-            ["taskkill", "/F", "/IM", "LuckyEngine.exe"],
+            [taskkill, "/F", "/IM", "LuckyEngine.exe"],
             capture_output=True,
             text=True,
             timeout=10,
@@ -228,7 +228,9 @@ class LuckyEnv:
             agent_name=self._agent_name,
         )
 
-        obs = np.array(obs_response.observation, dtype=np.float32)
+        # Fresh writable copy: the response's array is read-only, and Gymnasium
+        # wrappers (normalisation, frame stacking) edit observations in place.
+        obs = np.array(obs_response.observation)
         info = self._build_info(obs_response)
 
         return obs, info
@@ -244,13 +246,12 @@ class LuckyEnv:
         """
         self._step_count += 1
 
-        action_list = action.tolist() if hasattr(action, "tolist") else list(action)
         obs_response = self._client.step(
-            actions=action_list,
+            actions=action,
             agent_name=self._agent_name,
         )
 
-        obs = np.array(obs_response.observation, dtype=np.float32)
+        obs = np.array(obs_response.observation)
 
         # Compute reward from engine signals
         reward_signals = obs_response.reward_signals or {}
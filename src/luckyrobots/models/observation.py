@@ -1,11 +1,12 @@
 """RL observation models for LuckyRobots."""
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional
-from pydantic import BaseModel, Field, ConfigDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
+import numpy as np
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class CameraFrame:
     """A single camera frame returned from the engine."""
     name: str
@@ -15,70 +16,179 @@ class CameraFrame:
     channels: int
     frame_number: int
 
+    @classmethod
+    def from_proto(cls, frame: Any, name: str = "") -> "CameraFrame":
+        """Build a CameraFrame from an ``ImageFrame`` proto.
+
+        The pixel payload is read from the proto exactly once; ``image`` then
+        views that buffer without further copies.
+
+        Args:
+            frame: ``ImageFrame`` message (from Step or a camera stream).
+            name: Camera name to record on the frame.
+
+        Returns:
+            CameraFrame wrapping the frame payload and dimensions.
+        """
+        return cls(
+            name=name,
+            data=frame.data,
+            width=frame.width,
+            height=frame.height,
+            channels=frame.channels,
+            frame_number=frame.frame_number,
+        )
+
+    @property
+    def image(self) -> np.ndarray:
+        """Pixel data as a ``(height, width, channels)`` uint8 array.
+
+        The array is a read-only view over ``data`` — no pixel copy is made.
+        Call ``.copy()`` on the result if you need to modify it in place.
+        """
+        return np.frombuffer(self.data, dtype=np.uint8).reshape(
+            self.height, self.width, self.channels
+        )
+
 
-class ObservationResponse(BaseModel):
+@dataclass(frozen=True, slots=True, eq=False)
+class ObservationResponse:
     """RL observation data from an agent.
 
     This is the return type for LuckyEngineClient.step(). It contains the RL observation vector
     with optional named access for debugging.
 
+    Fields are populated from trusted gRPC responses, so no per-field validation is performed.
+    ``observation`` and ``actions`` are stored as read-only 1-D float32 arrays (the wire
+    precision); any sequence passed to the constructor is converted, so values round to
+    float32. Call ``.copy()`` on them to modify in place. Equality compares all fields by
+    value.
+
+    Attributes:
+        observation: Flat observation vector from the agent's observation spec.
+        actions: Last applied actions.
+        timestamp_ms: Wall-clock timestamp in milliseconds.
+        frame_number: Monotonic frame counter.
+        agent_name: Agent identifier.
+        observation_names: Observation names from agent schema (enables named access).
+        action_names: Action names from agent schema.
+        camera_frames: Camera frames synchronized with this observation.
+        reward_signals: Engine-computed reward signals keyed by term name (unweighted).
+        terminated: True if a hard termination condition was triggered.
+        truncated: True if the episode was truncated (e.g., time limit).
+        info: Auxiliary info for diagnostics.
+        termination_flags: Per-condition termination flags.
+
     Usage:
         obs = client.step(actions)
 
         # Flat vector for RL training
-        obs.observation  # [0.1, 0.2, 0.3, ...]
+        obs.observation  # array([0.1, 0.2, 0.3, ...], dtype=float32)
 
         # Named access (if schema was fetched)
         obs["proj_grav_x"]  # 0.1
         obs.to_dict()  # {"proj_grav_x": 0.1, "proj_grav_y": 0.2, ...}
     """
 
-    model_config = ConfigDict(frozen=True)
-
-    observation: List[float] = Field(
-        description="Flat observation vector from the agent's observation spec"
-    )
-    actions: List[float] = Field(description="Last applied actions")
-    timestamp_ms: int = Field(description="Wall-clock timestamp in milliseconds")
-    frame_number: int = Field(description="Monotonic frame counter")
-    agent_name: str = Field(description="Agent identifier")
+    observation: np.ndarray
+    actions: np.ndarray
+    timestamp_ms: int
+    frame_number: int
+    agent_name: str
 
     # Optional named access (populated if schema is available)
-    observation_names: Optional[List[str]] = Field(
-        default=None,
-        description="Observation names from agent schema (enables named access)",
-    )
-    action_names: Optional[List[str]] = Field(
-        default=None,
-        description="Action names from agent schema",
-    )
-    camera_frames: List[CameraFrame] = Field(
-        default_factory=list,
-        description="Camera frames synchronized with this observation",
-    )
+    observation_names: Optional[List[str]] = None
+    action_names: Optional[List[str]] = None
+    camera_frames: List[CameraFrame] = field(default_factory=list)
 
     # Enriched step data (populated when a negotiated task session is active)
-    reward_signals: Optional[Dict[str, float]] = Field(
-        default=None,
-        description="Engine-computed reward signals keyed by term name (unweighted)",
-    )
-    terminated: bool = Field(
-        default=False,
-        description="True if a hard termination condition was triggered",
-    )
-    truncated: bool = Field(
-        default=False,
-        description="True if the episode was truncated (e.g., time limit)",
-    )
-    info: Optional[Dict[str, float]] = Field(
-        default=None,
-        description="Auxiliary info for diagnostics",
+    reward_signals: Optional[Dict[str, float]] = None
+    terminated: bool = False
+    truncated: bool = False
+    info: Optional[Dict[str, float]] = None
+    termination_flags: Optional[Dict[str, bool]] = None
+
+    # Derived lookups, computed once per instance (the dataclass is frozen).
+    _name_index: Optional[Dict[str, int]] = field(
+        default=None, init=False, repr=False, compare=False
     )
-    termination_flags: Optional[Dict[str, bool]] = Field(
-        default=None,
-        description="Per-condition termination flags",
+    _obs_dict: Optional[Dict[str, float]] = field(
+        default=None, init=False, repr=False, compare=False
     )
 
+    def __post_init__(self) -> None:
+        # asarray is a no-op for float32 input (the from_proto path). The view keeps
+        # a caller's own array writable while this one is frozen, so in-place edits
+        # can't silently desync the memoised to_dict().
+        for name in ("observation", "actions"):
+            arr = np.asarray(getattr(self, name), dtype=np.float32).view()
+            arr.flags.writeable = False
+            object.__setattr__(self, name, arr)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            np.array_equal(self.observation, other.observation)
+            and np.array_equal(self.actions, other.actions)
+            and self.timestamp_ms == other.timestamp_ms
+            and self.frame_number == other.frame_number
+            and self.agent_name == other.agent_name
+            and self.observation_names == other.observation_names
+            and self.action_names == other.action_names
+            and self.camera_frames == other.camera_frames
+            and self.reward_signals == other.reward_signals
+            and self.terminated == other.terminated
+            and self.truncated == other.truncated
+            and self.info == other.info
+            and self.termination_flags == other.termination_flags
+        )
+
+    @classmethod
+    def from_proto(
+        cls,
+        resp: Any,
+        agent_name: str,
+        observation_names: Optional[List[str]] = None,
+        action_names: Optional[List[str]] = None,
+    ) -> "ObservationResponse":
+        """Build an ObservationResponse from a StepResponse proto.
+
+        The proto is trusted input (already typed by protobuf), so values are
+        copied out as-is without further validation.
+
+        Args:
+            resp: StepResponse message returned by AgentService.Step.
+            agent_name: Agent identifier to record on the response.
+            observation_names: Cached observation names from the agent schema.
+            action_names: Cached action names from the agent schema.
+
+        Returns:
+            ObservationResponse populated from the proto.
+        """
+        agent_frame = resp.observation
+        camera_frames = [CameraFrame.from_proto(nf.frame, nf.name) for nf in resp.camera_frames]
+
+        observations = agent_frame.observations
+        actions = agent_frame.actions
+        return cls(
+            observation=np.fromiter(observations, dtype=np.float32, count=len(observations)),
+            actions=np.fromiter(actions, dtype=np.float32, count=len(actions)),
+            timestamp_ms=agent_frame.timestamp_ms,
+            frame_number=agent_frame.frame_number,
+            agent_name=agent_name,
+            observation_names=observation_names,
+            action_names=action_names,
+            camera_frames=camera_frames,
+            reward_signals=dict(resp.reward_signals) if resp.reward_signals else None,
+            terminated=resp.terminated,
+            truncated=resp.truncated,
+            info=dict(resp.info) if resp.info else None,
+            termination_flags=(
+                dict(resp.termination_flags) if resp.termination_flags else None
+            ),
+        )
+
     def __getitem__(self, key: str) -> float:
         """Access observation value by name.
 
@@ -96,14 +206,19 @@ class ObservationResponse(BaseModel):
                 f"No observation names available. "
                 f"Ensure client has fetched schema via get_agent_schema()."
             )
+        name_index = self._name_index
+        if name_index is None:
+            # Built on first named access only; vector-only consumers never pay for it.
+            name_index = {n: i for i, n in enumerate(self.observation_names)}
+            object.__setattr__(self, "_name_index", name_index)
         try:
-            idx = self.observation_names.index(key)
-            return self.observation[idx]
-        except ValueError:
+            idx = name_index[key]
+        except KeyError:
             raise KeyError(
                 f"Unknown observation name: '{key}'. "
                 f"Available: {self.observation_names}"
-            )
+            ) from None
+        return float(self.observation[idx])
 
     def get(self, key: str, default: Optional[float] = None) -> Optional[float]:
         """Get observation value by name with optional default.
@@ -125,11 +240,16 @@ class ObservationResponse(BaseModel):
 
         Returns:
             Dict mapping observation names to values. If names not available,
-            uses "obs_0", "obs_1", etc.
+            uses "obs_0", "obs_1", etc. The mapping is built once per
+            instance; each call returns a fresh shallow copy of it.
         """
-        if self.observation_names is not None:
-            return dict(zip(self.observation_names, self.observation))
-        return {f"obs_{i}": v for i, v in enumerate(self.observation)}
+        if self._obs_dict is None:
+            if self.observation_names is not None:
+                obs_dict = dict(zip(self.observation_names, self.observation.tolist()))
+            else:
+                obs_dict = {f"obs_{i}": v for i, v in enumerate(self.observation.tolist())}
+            object.__setattr__(self, "_obs_dict", obs_dict)
+        return dict(self._obs_dict)
 
     def actions_to_dict(self) -> Dict[str, float]:
         """Convert actions to a name->value dictionary.
@@ -139,5 +259,5 @@ class ObservationResponse(BaseModel):
             uses "action_0", "action_1", etc.
         """
         if self.action_names is not None:
-            return dict(zip(self.action_names, self.actions))
-        return {f"action_{i}": v for i, v in enumerate(self.actions)}
+            return dict(zip(self.action_names, self.actions.tolist()))
+        return {f"action_{i}": v for i, v in enumerate(self.actions.tolist())}
@@ -2,7 +2,7 @@ import logging
 from collections.abc import Sequence
 from typing import Any, Optional
 
-from .engine import launch_luckyengine, stop_luckyengine
+from .engine import is_luckyengine_running, launch_luckyengine, stop_luckyengine
 from .models import ObservationResponse
 from .client import LuckyEngineClient, GrpcConnectionError
 from .utils import validate_params, get_robot_config
@@ -28,9 +28,13 @@ class Session:
 
         self._engine_client: Optional[LuckyEngineClient] = None
         self._robot_name: Optional[str] = None
+        # True when start() attached to an engine it did not launch
+        self._engine_attached = False
 
         # Cached metadata (filled after connect)
         self._joint_names: Optional[list[str]] = None
+        # Zero action vector per agent name, reused by reset() (filled lazily)
+        self._zero_actions: dict[str, list[float]] = {}
 
     @staticmethod
     def get_robot_config(robot: str = None) -> dict:
@@ -47,6 +51,7 @@ class Session:
         headless: bool = False,
         timeout_s: float = 120.0,
         task_contract: dict | None = None,
+        reuse_engine: bool = False,
     ) -> None:
         """
         Launch LuckyEngine (if needed) and connect to gRPC.
@@ -64,18 +69,28 @@ class Session:
                 and termination flags alongside observations. Pass a dict with
                 observations, rewards, terminations sections — see LuckyEnv or
                 luckylab.contracts.TaskContract.to_dict() for the expected format.
+            reuse_engine: Attach to an already running LuckyEngine instead of
+                failing to launch a second one. An attached engine is never
+                stopped by this session's ``close()``, so one warm engine can
+                serve many sessions (e.g. hyperparameter sweeps); the running
+                engine must already have the requested scene and robot loaded.
         """
         self._robot_name = robot
 
-        success = launch_luckyengine(
-            scene=scene,
-            robot=robot,
-            task=task,
-            executable_path=executable_path,
-            headless=headless,
-            auto_play=True,
-            grpc_port=self.port,
-        )
+        self._engine_attached = reuse_engine and is_luckyengine_running()
+        if self._engine_attached:
+            logger.info("Reusing running LuckyEngine instance")
+            success = True
+        else:
+            success = launch_luckyengine(
+                scene=scene,
+                robot=robot,
+                task=task,
+                executable_path=executable_path,
+                headless=headless,
+                auto_play=True,
+                grpc_port=self.port,
+            )
         if not success:
             logger.error("Failed to launch LuckyEngine")
             raise RuntimeError(
@@ -123,6 +138,7 @@ class Session:
         if not self._robot_name:
             raise ValueError("Robot name is required (pass `robot=` or call start()).")
 
+        self._zero_actions.clear()
         self._engine_client = LuckyEngineClient(
             host=self.host,
             port=self.port,
@@ -241,7 +257,7 @@ class Session:
         """
         client = self._require_client()
         return client.step(
-            actions=list(actions) if actions is not None else None,
+            actions=actions,
             agent_name=agent_name,
             action_groups=action_groups,
         )
@@ -356,7 +372,8 @@ class Session:
 
         Args:
             agent_name: Agent logical name. Empty string means default agent.
-            randomization_cfg: Optional domain randomization config for this reset.
+            randomization_cfg: Optional domain randomization config for this reset
+                (e.g. a ``DomainRandomizationConfig`` or a mapping).
                 Use this to randomize physics parameters (friction, mass, etc.)
                 at the start of each episode for sim-to-real transfer.
 
@@ -383,10 +400,14 @@ class Session:
             break
 
         # Step with zero actions to get the initial observation after reset.
-        # Query the agent schema for the correct action size (cached after first call).
-        schema = client.get_agent_schema(agent_name=agent_name)
-        action_size = schema.schema.action_size if schema.schema else 12
-        return client.step(actions=[0.0] * action_size, agent_name=agent_name)
+        # The action size only changes with the scene, so the schema is queried
+        # once per agent and connection rather than on every episode.
+        zero_actions = self._zero_actions.get(agent_name)
+        if zero_actions is None:
+            schema = client.get_agent_schema(agent_name=agent_name)
+            action_size = schema.schema.action_size if schema.schema else 12
+            zero_actions = self._zero_actions[agent_name] = [0.0] * action_size
+        return client.step(actions=zero_actions, agent_name=agent_name)
 
     def report_progress(self, **kwargs) -> None:
         """Report evaluation/training progress to the engine for UI display.
@@ -398,14 +419,18 @@ class Session:
         client.report_progress(**kwargs)
 
     def close(self, stop_engine: bool = True) -> None:
-        """Close gRPC client and optionally stop the engine executable."""
+        """Close gRPC client and optionally stop the engine executable.
+
+        An engine this session attached to via ``start(reuse_engine=True)`` is
+        left running regardless of ``stop_engine``.
+        """
         if self._engine_client is not None:
             try:
                 self._engine_client.close()
             finally:
                 self._engine_client = None
 
-        if stop_engine:
+        if stop_engine and not self._engine_attached:
             stop_luckyengine()
 
     def __enter__(self) -> "Session":
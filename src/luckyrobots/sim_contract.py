@@ -6,7 +6,98 @@ messages used by LuckyEngine agent resets.
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass(frozen=True, slots=True)
+class DomainRandomizationConfig:
+    """Typed simulation contract for ``reset_agent(randomization_cfg=...)``.
+
+    Every field is optional; ``None`` leaves the engine default (or the
+    previous reset's value) in place. Ranges are ``(min, max)`` pairs.
+
+    Attributes:
+        pose_position_noise: ``(x, y, z)`` initial position noise std.
+        pose_orientation_noise: Initial orientation noise std (radians).
+        joint_position_noise: Initial joint position noise std.
+        joint_velocity_noise: Initial joint velocity noise std.
+        friction_range: Surface friction coefficient range.
+        restitution_range: Bounce/restitution coefficient range.
+        mass_scale_range: Body mass multiplier range.
+        com_offset_range: Center of mass offset range.
+        motor_strength_range: Motor strength multiplier range.
+        motor_offset_range: Motor position offset range.
+        push_interval_range: Time between external pushes (seconds).
+        push_velocity_range: External push velocity magnitude.
+        terrain_type: Terrain type identifier.
+        terrain_difficulty: Terrain difficulty level.
+        vel_command_x_range: Forward velocity command range (m/s).
+        vel_command_y_range: Lateral velocity command range (m/s).
+        vel_command_yaw_range: Yaw rate command range (rad/s).
+        vel_command_resampling_time_range: Command resampling interval (seconds).
+        vel_command_standing_probability: Probability of a zero command, in ``[0, 1]``.
+    """
+
+    pose_position_noise: Optional[tuple[float, float, float]] = None
+    pose_orientation_noise: Optional[float] = None
+    joint_position_noise: Optional[float] = None
+    joint_velocity_noise: Optional[float] = None
+    friction_range: Optional[tuple[float, float]] = None
+    restitution_range: Optional[tuple[float, float]] = None
+    mass_scale_range: Optional[tuple[float, float]] = None
+    com_offset_range: Optional[tuple[float, float]] = None
+    motor_strength_range: Optional[tuple[float, float]] = None
+    motor_offset_range: Optional[tuple[float, float]] = None
+    push_interval_range: Optional[tuple[float, float]] = None
+    push_velocity_range: Optional[tuple[float, float]] = None
+    terrain_type: Optional[str] = None
+    terrain_difficulty: Optional[float] = None
+    vel_command_x_range: Optional[tuple[float, float]] = None
+    vel_command_y_range: Optional[tuple[float, float]] = None
+    vel_command_yaw_range: Optional[tuple[float, float]] = None
+    vel_command_resampling_time_range: Optional[tuple[float, float]] = None
+    vel_command_standing_probability: Optional[float] = None
+
+    def to_proto(self, pb_agent: Any) -> Any:
+        """Build a SimulationContract message; see the module-level ``to_proto``.
+
+        Args:
+            pb_agent: The agent protobuf module (client.pb.agent).
+
+        Returns:
+            A SimulationContract protobuf message.
+        """
+        return to_proto(pb_agent, self)
+
+
+# Repeated (vector/range) fields, copied when non-empty.
+_LIST_FIELDS: tuple[str, ...] = (
+    "pose_position_noise",
+    "friction_range",
+    "restitution_range",
+    "mass_scale_range",
+    "com_offset_range",
+    "motor_strength_range",
+    "motor_offset_range",
+    "push_interval_range",
+    "push_velocity_range",
+    "vel_command_x_range",
+    "vel_command_y_range",
+    "vel_command_yaw_range",
+    "vel_command_resampling_time_range",
+)
+
+# Scalar fields with their proto defaults; values equal to the default are skipped.
+_SCALAR_FIELDS: tuple[tuple[str, Any], ...] = (
+    ("pose_orientation_noise", 0.0),
+    ("joint_position_noise", 0.0),
+    ("joint_velocity_noise", 0.0),
+    ("terrain_type", ""),
+    ("terrain_difficulty", 0.0),
+    ("vel_command_standing_probability", 0.0),
+)
 
 
 def to_proto(pb_agent: Any, config: Any) -> Any:
@@ -14,100 +105,28 @@ def to_proto(pb_agent: Any, config: Any) -> Any:
 
     Args:
         pb_agent: The agent protobuf module (client.pb.agent).
-        config: Config object with optional simulation contract attributes
-            (randomization, velocity commands, terrain, etc.).
+        config: Config object or mapping with optional simulation contract
+            attributes (randomization, velocity commands, terrain, etc.).
 
     Returns:
         A SimulationContract protobuf message.
     """
-    proto_kwargs: dict[str, Any] = {}
-
-    def get_val(name: str, default=None):
-        val = getattr(config, name, default)
-        if val is None or (isinstance(val, (tuple, list)) and len(val) == 0):
-            return None
-        return val
-
-    # Initial state randomization
-    pose_pos = get_val("pose_position_noise")
-    if pose_pos is not None:
-        proto_kwargs["pose_position_noise"] = list(pose_pos)
-
-    pose_ori = get_val("pose_orientation_noise")
-    if pose_ori is not None and pose_ori != 0.0:
-        proto_kwargs["pose_orientation_noise"] = pose_ori
-
-    joint_pos = get_val("joint_position_noise")
-    if joint_pos is not None and joint_pos != 0.0:
-        proto_kwargs["joint_position_noise"] = joint_pos
-
-    joint_vel = get_val("joint_velocity_noise")
-    if joint_vel is not None and joint_vel != 0.0:
-        proto_kwargs["joint_velocity_noise"] = joint_vel
-
-    # Physics parameters
-    friction = get_val("friction_range")
-    if friction is not None:
-        proto_kwargs["friction_range"] = list(friction)
-
-    restitution = get_val("restitution_range")
-    if restitution is not None:
-        proto_kwargs["restitution_range"] = list(restitution)
-
-    mass_scale = get_val("mass_scale_range")
-    if mass_scale is not None:
-        proto_kwargs["mass_scale_range"] = list(mass_scale)
-
-    com_offset = get_val("com_offset_range")
-    if com_offset is not None:
-        proto_kwargs["com_offset_range"] = list(com_offset)
-
-    # Motor/actuator
-    motor_strength = get_val("motor_strength_range")
-    if motor_strength is not None:
-        proto_kwargs["motor_strength_range"] = list(motor_strength)
-
-    motor_offset = get_val("motor_offset_range")
-    if motor_offset is not None:
-        proto_kwargs["motor_offset_range"] = list(motor_offset)
-
-    # External disturbances
-    push_interval = get_val("push_interval_range")
-    if push_interval is not None:
-        proto_kwargs["push_interval_range"] = list(push_interval)
-
-    push_velocity = get_val("push_velocity_range")
-    if push_velocity is not None:
-        proto_kwargs["push_velocity_range"] = list(push_velocity)
-
-    # Terrain
-    terrain_type = get_val("terrain_type")
-    if terrain_type is not None and terrain_type != "":
-        proto_kwargs["terrain_type"] = terrain_type
-
-    terrain_diff = get_val("terrain_difficulty")
-    if terrain_diff is not None and terrain_diff != 0.0:
-        proto_kwargs["terrain_difficulty"] = terrain_diff
-
-    # Velocity command ranges (sampled by engine)
-    vel_x = get_val("vel_command_x_range")
-    if vel_x is not None:
-        proto_kwargs["vel_command_x_range"] = list(vel_x)
-
-    vel_y = get_val("vel_command_y_range")
-    if vel_y is not None:
-        proto_kwargs["vel_command_y_range"] = list(vel_y)
-
-    vel_yaw = get_val("vel_command_yaw_range")
-    if vel_yaw is not None:
-        proto_kwargs["vel_command_yaw_range"] = list(vel_yaw)
-
-    resample_time = get_val("vel_command_resampling_time_range")
-    if resample_time is not None:
-        proto_kwargs["vel_command_resampling_time_range"] = list(resample_time)
-
-    standing_prob = get_val("vel_command_standing_probability")
-    if standing_prob is not None and standing_prob != 0.0:
-        proto_kwargs["vel_command_standing_probability"] = standing_prob
-
-    return pb_agent.SimulationContract(**proto_kwargs)
+    if isinstance(config, Mapping):
+        get = config.get
+    else:
+        def get(name: str) -> Any:
+            return getattr(config, name, None)
+
+    msg = pb_agent.SimulationContract()
+
+    for name in _LIST_FIELDS:
+        value = get(name)
+        if value is not None and len(value) > 0:
+            getattr(msg, name).extend(value)
+
+    for name, default in _SCALAR_FIELDS:
+        value = get(name)
+        if value is not None and value != default:
+            setattr(msg, name, value)
+
+    return msg
@@ -5,45 +5,70 @@ identify physical parameters by comparing real vs. simulated behavior,
 and apply calibrated parameters to MuJoCo XML models.
 
 Install: pip install luckyrobots[sysid]
+
+Submodules are imported on first attribute access, so loading the
+``luckyrobots sysid`` CLI group does not import every module up front.
 """
 
-# Data
-from .trajectory import TrajectoryData as TrajectoryData
-
-# Parameters
-from .parameters import ParamSpec as ParamSpec
-from .parameters import get_param as get_param
-from .parameters import set_param as set_param
-from .parameters import load_preset as load_preset
-
-# System identification
-from .sysid import SysIdResult as SysIdResult
-from .sysid import identify as identify
-
-# Calibration
-from .calibrate import apply_params as apply_params
-
-# Collection
-from .collector import Collector as Collector
-from .collector import EngineCollector as EngineCollector
-
-# Excitation signals
-from .excitation import chirp as chirp
-from .excitation import multisine as multisine
-from .excitation import random_steps as random_steps
-
-__all__ = [
-    "TrajectoryData",
-    "ParamSpec",
-    "get_param",
-    "set_param",
-    "load_preset",
-    "SysIdResult",
-    "identify",
-    "apply_params",
-    "Collector",
-    "EngineCollector",
-    "chirp",
-    "multisine",
-    "random_steps",
-]
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Data
+    from .trajectory import TrajectoryData as TrajectoryData
+
+    # Parameters
+    from .parameters import ParamSpec as ParamSpec
+    from .parameters import get_param as get_param
+    from .parameters import set_param as set_param
+    from .parameters import load_preset as load_preset
+
+    # System identification
+    from .sysid import SysIdResult as SysIdResult
+    from .sysid import identify as identify
+
+    # Calibration
+    from .calibrate import apply_params as apply_params
+
+    # Collection
+    from .collector import Collector as Collector
+    from .collector import EngineCollector as EngineCollector
+
+    # Excitation signals
+    from .excitation import chirp as chirp
+    from .excitation import multisine as multisine
+    from .excitation import random_steps as random_steps
+
+# Public name -> defining submodule.
+_EXPORTS = {
+    "TrajectoryData": "trajectory",
+    "ParamSpec": "parameters",
+    "get_param": "parameters",
+    "set_param": "parameters",
+    "load_preset": "parameters",
+    "SysIdResult": "sysid",
+    "identify": "sysid",
+    "apply_params": "calibrate",
+    "Collector": "collector",
+    "EngineCollector": "collector",
+    "chirp": "excitation",
+    "multisine": "excitation",
+    "random_steps": "excitation",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
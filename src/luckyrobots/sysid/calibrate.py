@@ -19,7 +19,7 @@ def apply_params(
     """Apply identified parameters to a MuJoCo XML model.
 
     Loads the XML, modifies attributes in-place using ElementTree,
-    and writes the calibrated model to output_path.
+    and writes the serialized model to output_path in a single write.
 
     Args:
         model_xml: Path to original MuJoCo XML.
@@ -35,48 +35,58 @@ def apply_params(
     model_xml = Path(model_xml)
     output_path = Path(output_path)
 
-    tree = ET.parse(model_xml)
-    root = tree.getroot()
+    root = ET.parse(model_xml).getroot()
 
+    index = _ElementIndex(root)
     for name, value in result.params.items():
-        _apply_single_param(root, name, value)
+        _apply_single_param(index, name, value)
 
-    tree.write(str(output_path), xml_declaration=True)
+    output_path.write_bytes(ET.tostring(root, encoding="us-ascii", xml_declaration=True))
     logger.info("Calibrated model written to %s", output_path)
     return output_path
 
 
-def _apply_single_param(root: ET.Element, param_name: str, value: float) -> None:
-    """Apply a single parameter change to an XML tree."""
-    # Search joints
-    for joint in root.iter("joint"):
-        jname = joint.get("name", "")
-        short = jname.replace("_joint", "")
-        if param_name == f"{short}_armature":
-            joint.set("armature", str(value))
-            return
-        if param_name == f"{short}_damping":
-            joint.set("damping", str(value))
-            return
-        if param_name == f"{short}_frictionloss":
-            joint.set("frictionloss", str(value))
-            return
-
-    # Search bodies
-    for body in root.iter("body"):
-        bname = body.get("name", "")
-        if param_name == f"{bname}_mass":
+class _ElementIndex:
+    """Name lookups for the joints, bodies and geoms of an XML tree.
+
+    Built in one pass per element type so each parameter resolves with a
+    dict lookup instead of rescanning the tree. The first element with a
+    given name wins, matching document order.
+    """
+
+    def __init__(self, root: ET.Element) -> None:
+        self.joints: dict[str, ET.Element] = {}
+        for joint in root.iter("joint"):
+            self.joints.setdefault(joint.get("name", "").replace("_joint", ""), joint)
+        self.bodies: dict[str, ET.Element] = {}
+        for body in root.iter("body"):
+            self.bodies.setdefault(body.get("name", ""), body)
+        self.geoms: dict[str, ET.Element] = {}
+        for geom in root.iter("geom"):
+            self.geoms.setdefault(geom.get("name", ""), geom)
+
+
+_JOINT_ATTRS = frozenset(("armature", "damping", "frictionloss"))
+
+
+def _apply_single_param(index: _ElementIndex, param_name: str, value: float) -> None:
+    """Apply a single parameter change to an indexed XML tree."""
+    target, _, kind = param_name.rpartition("_")
+
+    if kind in _JOINT_ATTRS:
+        joint = index.joints.get(target)
+        if joint is not None:
+            joint.set(kind, str(value))
+    elif kind == "mass":
+        body = index.bodies.get(target)
+        if body is not None:
             inertial = body.find("inertial")
             if inertial is not None:
                 inertial.set("mass", str(value))
-            return
-
-    # Search geoms
-    for geom in root.iter("geom"):
-        gname = geom.get("name", "")
-        if param_name == f"{gname}_friction":
+    elif kind == "friction":
+        geom = index.geoms.get(target)
+        if geom is not None:
             existing = geom.get("friction", "1 0.005 0.0001")
             parts = existing.split()
             parts[0] = str(value)
             geom.set("friction", " ".join(parts))
-            return
@@ -31,7 +31,9 @@ def sysid():
 @click.option("--dt", default=0.02, type=float, help="Timestep (seconds).")
 @click.option("--amplitude", default=0.3, type=float, help="Signal amplitude.")
 @click.option("--num-joints", default=12, type=int, help="Number of joints.")
-@click.option("-o", "--output", default="trajectory.npz", help="Output file path.")
+@click.option(
+    "-o", "--output", default="trajectory", help="Output directory (or a .npz file path).",
+)
 def collect(host, port, robot, signal, duration, dt, amplitude, num_joints, output):
     """Collect trajectory data from LuckyEngine."""
     from .collector import EngineCollector
@@ -66,8 +68,9 @@ def collect(host, port, robot, signal, duration, dt, amplitude, num_joints, outp
 @click.option("--preset", default=None, help="Parameter preset (e.g. go2:motor).")
 @click.option("--max-iter", default=100, type=int, help="Max optimization iterations.")
 @click.option("--report-dir", default=None, help="Directory for identification report.")
+@click.option("--workers", default=1, type=int, help="Worker processes for Jacobian rollouts.")
 @click.option("-o", "--output", default="sysid_result.json", help="Output result file.")
-def identify(data_path, model, preset, max_iter, report_dir, output):
+def identify(data_path, model, preset, max_iter, report_dir, workers, output):
     """Identify model parameters from trajectory data."""
     from .trajectory import TrajectoryData
     from .sysid import identify as run_identify
@@ -89,6 +92,7 @@ def identify(data_path, model, preset, max_iter, report_dir, output):
         param_specs=specs,
         report_dir=report_dir,
         max_iterations=max_iter,
+        workers=workers,
     )
 
     result.save(output)
@@ -125,18 +129,19 @@ def apply(result_path, model, output):
 @click.option("--robot", default=None, help="Filter by robot name.")
 def presets(robot):
     """List available parameter presets."""
-    from .parameters import GO2_PRESETS
+    from .parameters import available_presets, load_preset
 
-    all_presets = {"go2": GO2_PRESETS}
+    all_presets = available_presets()
 
     if robot:
-        filtered = {robot.lower(): all_presets.get(robot.lower(), {})}
+        filtered = {robot.lower(): all_presets.get(robot.lower(), [])}
     else:
         filtered = all_presets
 
     for rname, groups in filtered.items():
         click.echo(f"\n{rname}:")
-        for gname, specs in groups.items():
+        for gname in groups:
+            specs = load_preset(rname, gname)
             click.echo(f"  {rname}:{gname} ({len(specs)} parameters)")
             for spec in specs:
                 click.echo(
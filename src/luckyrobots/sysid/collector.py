@@ -63,29 +63,28 @@ class EngineCollector(Collector):
             raise RuntimeError("Not connected. Call connect() first.")
 
         T, nu = ctrl_sequence.shape
-        times = np.zeros(T)
-        qpos_list = []
-        qvel_list = []
-        ctrl_list = []
+        times = np.arange(T) * dt
+        ctrl_rows = ctrl_sequence.tolist()
+        # Sized from the first joint state, since nq/nv aren't known up front.
+        qpos = qvel = np.empty((0, 0))
 
         self._client.reset_agent()
 
         for t in range(T):
-            ctrl = ctrl_sequence[t].tolist()
+            state = self._client.get_joint_state(self.robot_name).state
+            if t == 0:
+                qpos = np.empty((T, len(state.positions)))
+                qvel = np.empty((T, len(state.velocities)))
+            qpos[t] = state.positions
+            qvel[t] = state.velocities
 
-            state = self._client.get_joint_state(self.robot_name)
-            qpos_list.append(np.array(state.state.positions))
-            qvel_list.append(np.array(state.state.velocities))
-
-            self._client.step(actions=ctrl)
-            ctrl_list.append(ctrl_sequence[t])
-            times[t] = t * dt
+            self._client.step(actions=ctrl_rows[t])
 
         return TrajectoryData(
             times=times,
-            qpos=np.array(qpos_list),
-            qvel=np.array(qvel_list),
-            ctrl=np.array(ctrl_list),
+            qpos=qpos,
+            qvel=qvel,
+            ctrl=ctrl_sequence.copy(),
             metadata={
                 "source": "luckyengine",
                 "host": self.host,
@@ -28,12 +28,18 @@ def chirp(
     """
     T = int(duration / dt)
     t = np.linspace(0, duration, T)
-    phase = 2 * np.pi * (f0 * t + (f1 - f0) / (2 * duration) * t ** 2)
-
-    ctrl = np.zeros((T, num_joints))
-    for j in range(num_joints):
-        ctrl[:, j] = amplitude * np.sin(phase + 2 * np.pi * j / num_joints)
-
+    # 2*pi*(f0*t + k*t^2) in Horner form: t * (f0 + k*t), built in place.
+    phase = t * ((f1 - f0) / (2 * duration))
+    phase += f0
+    phase *= t
+    phase *= 2 * np.pi
+
+    # Joints differ only by a constant offset, so
+    # sin(phase + off) = sin(phase) cos(off) + cos(phase) sin(off):
+    # 2T transcendental evaluations instead of T * num_joints.
+    offsets = 2 * np.pi * np.arange(num_joints) / num_joints
+    ctrl = np.outer(np.sin(phase), amplitude * np.cos(offsets))
+    ctrl += np.outer(np.cos(phase), amplitude * np.sin(offsets))
     return ctrl
 
 
@@ -60,17 +66,21 @@ def multisine(
         frequencies = [0.5, 1.0, 2.0, 3.5]
 
     T = int(duration / dt)
+    if len(frequencies) == 0:
+        return np.zeros((T, num_joints))
+
     t = np.linspace(0, duration, T)
-    ctrl = np.zeros((T, num_joints))
+    omega = 2 * np.pi * np.asarray(frequencies, dtype=float)
 
+    # Drawn joint-major, frequency-minor: same sequence as one draw per (joint, freq).
     rng = np.random.default_rng(42)
-    for j in range(num_joints):
-        for freq in frequencies:
-            phase = rng.uniform(0, 2 * np.pi)
-            ctrl[:, j] += amplitude / len(frequencies) * np.sin(
-                2 * np.pi * freq * t + phase
-            )
+    phases = rng.uniform(0, 2 * np.pi, size=(num_joints, len(frequencies)))
 
+    # sin(wt + p) = sin(wt) cos(p) + cos(wt) sin(p): only F sin/cos curves of
+    # length T are evaluated; per-joint phases mix them in through two matmuls.
+    wt = np.outer(t, omega)
+    ctrl = np.sin(wt) @ np.cos(phases).T + np.cos(wt) @ np.sin(phases).T
+    ctrl *= amplitude / len(frequencies)
     return ctrl
 
 
@@ -97,12 +107,8 @@ def random_steps(
     """
     T = int(duration / dt)
     steps_per_hold = max(1, int(hold_time / dt))
-    ctrl = np.zeros((T, num_joints))
+    n_holds = -(-T // steps_per_hold)
 
     rng = np.random.default_rng(42)
-    for t in range(0, T, steps_per_hold):
-        values = rng.uniform(-amplitude, amplitude, size=num_joints)
-        end = min(t + steps_per_hold, T)
-        ctrl[t:end] = values
-
-    return ctrl
+    values = rng.uniform(-amplitude, amplitude, size=(n_holds, num_joints))
+    return np.repeat(values, steps_per_hold, axis=0)[:T]
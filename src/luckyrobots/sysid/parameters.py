@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
+from typing import Any, Callable
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParamSpec:
     """Specification for a single identifiable parameter.
 
@@ -86,13 +88,33 @@ def _go2_friction_params() -> list[ParamSpec]:
     return params
 
 
-GO2_PRESETS: dict[str, list[ParamSpec]] = {
-    "motor": _go2_motor_params(),
-    "inertial": _go2_inertial_params(),
-    "friction": _go2_friction_params(),
+# Preset factories per robot and group; specs are only built when requested.
+_PRESET_FACTORIES: dict[str, dict[str, Callable[[], list[ParamSpec]]]] = {
+    "go2": {
+        "motor": _go2_motor_params,
+        "inertial": _go2_inertial_params,
+        "friction": _go2_friction_params,
+    },
 }
 
 
+@functools.cache
+def _build_preset(robot: str, group: str) -> tuple[ParamSpec, ...]:
+    return tuple(_PRESET_FACTORIES[robot][group]())
+
+
+def __getattr__(name: str):
+    # GO2_PRESETS is built on first access rather than at import time.
+    if name == "GO2_PRESETS":
+        return {group: list(_build_preset("go2", group)) for group in _PRESET_FACTORIES["go2"]}
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def available_presets() -> dict[str, list[str]]:
+    """Return the preset group names available for each robot."""
+    return {robot: list(groups) for robot, groups in _PRESET_FACTORIES.items()}
+
+
 def load_preset(robot: str, group: str) -> list[ParamSpec]:
     """Load a parameter preset for a given robot and group.
 
@@ -103,24 +125,66 @@ def load_preset(robot: str, group: str) -> list[ParamSpec]:
     Returns:
         List of ParamSpec for the requested group.
     """
-    presets = {
-        "go2": GO2_PRESETS,
-    }
-    robot_presets = presets.get(robot.lower())
+    robot_presets = _PRESET_FACTORIES.get(robot.lower())
     if robot_presets is None:
-        raise ValueError(f"Unknown robot '{robot}'. Available: {list(presets.keys())}")
-    group_params = robot_presets.get(group.lower())
-    if group_params is None:
+        raise ValueError(f"Unknown robot '{robot}'. Available: {list(_PRESET_FACTORIES.keys())}")
+    if group.lower() not in robot_presets:
         raise ValueError(
             f"Unknown group '{group}' for robot '{robot}'. "
             f"Available: {list(robot_presets.keys())}"
         )
-    return group_params
+    return list(_build_preset(robot.lower(), group.lower()))
 
 
 # ── MuJoCo model parameter access ──
 
 
+# (element, attribute) -> (object type name, model array name, column or None)
+_PARAM_FIELDS: dict[tuple[str, str], tuple[str, str, int | None]] = {
+    ("joint", "armature"): ("mjOBJ_JOINT", "dof_armature", None),
+    ("joint", "damping"): ("mjOBJ_JOINT", "dof_damping", None),
+    ("joint", "frictionloss"): ("mjOBJ_JOINT", "dof_frictionloss", None),
+    ("body", "mass"): ("mjOBJ_BODY", "body_mass", None),
+    ("geom", "friction"): ("mjOBJ_GEOM", "geom_friction", 0),
+    ("actuator", "gainprm"): ("mjOBJ_ACTUATOR", "actuator_gainprm", 0),
+}
+
+
+def resolve_param(model, spec: ParamSpec) -> tuple[Any, int | tuple[int, int]]:
+    """Resolve a parameter to the model array and index that store it.
+
+    The returned array is a live view into the MuJoCo model, so
+    ``array[index] = value`` writes the parameter directly. Resolve once
+    and reuse the slot to avoid repeated name lookups in hot loops.
+
+    Args:
+        model: A mujoco.MjModel instance.
+        spec: Parameter specification.
+
+    Returns:
+        Tuple of (model array, index into it).
+
+    Raises:
+        ValueError: If the element is missing or the element/attribute
+            combination is unsupported.
+    """
+    import mujoco
+
+    field = _PARAM_FIELDS.get((spec.element, spec.attribute))
+    if field is None:
+        raise ValueError(f"Unsupported element/attribute: {spec.element}/{spec.attribute}")
+    obj_type, array_name, column = field
+
+    obj_id = mujoco.mj_name2id(model, getattr(mujoco.mjtObj, obj_type), spec.mj_name)
+    if obj_id < 0:
+        raise ValueError(f"{spec.element.capitalize()} '{spec.mj_name}' not found in model")
+    if spec.element == "joint":
+        obj_id = int(model.jnt_dofadr[obj_id])
+
+    index = obj_id if column is None else (obj_id, column)
+    return getattr(model, array_name), index
+
+
 def get_param(model, spec: ParamSpec) -> float:
     """Read a parameter value from a MuJoCo model.
 
@@ -134,39 +198,8 @@ def get_param(model, spec: ParamSpec) -> float:
     Raises:
         ValueError: If the element/attribute combination is unsupported.
     """
-    import mujoco
-
-    if spec.element == "joint":
-        joint_id = mujoco.mj_name2id(model, mujoco.mjtObj.mjOBJ_JOINT, spec.mj_name)
-        if joint_id < 0:
-            raise ValueError(f"Joint '{spec.mj_name}' not found in model")
-        dof_id = model.jnt_dofadr[joint_id]
-        if spec.attribute == "armature":
-            return float(model.dof_armature[dof_id])
-        elif spec.attribute == "damping":
-            return float(model.dof_damping[dof_id])
-        elif spec.attribute == "frictionloss":
-            return float(model.dof_frictionloss[dof_id])
-    elif spec.element == "body":
-        body_id = mujoco.mj_name2id(model, mujoco.mjtObj.mjOBJ_BODY, spec.mj_name)
-        if body_id < 0:
-            raise ValueError(f"Body '{spec.mj_name}' not found in model")
-        if spec.attribute == "mass":
-            return float(model.body_mass[body_id])
-    elif spec.element == "geom":
-        geom_id = mujoco.mj_name2id(model, mujoco.mjtObj.mjOBJ_GEOM, spec.mj_name)
-        if geom_id < 0:
-            raise ValueError(f"Geom '{spec.mj_name}' not found in model")
-        if spec.attribute == "friction":
-            return float(model.geom_friction[geom_id, 0])
-    elif spec.element == "actuator":
-        act_id = mujoco.mj_name2id(model, mujoco.mjtObj.mjOBJ_ACTUATOR, spec.mj_name)
-        if act_id < 0:
-            raise ValueError(f"Actuator '{spec.mj_name}' not found in model")
-        if spec.attribute == "gainprm":
-            return float(model.actuator_gainprm[act_id, 0])
-
-    raise ValueError(f"Unsupported element/attribute: {spec.element}/{spec.attribute}")
+    array, index = resolve_param(model, spec)
+    return float(array[index])
 
 
 def set_param(model, spec: ParamSpec, value: float) -> None:
@@ -176,27 +209,9 @@ def set_param(model, spec: ParamSpec, value: float) -> None:
         model: A mujoco.MjModel instance.
         spec: Parameter specification.
         value: The value to set.
-    """
-    import mujoco
 
-    if spec.element == "joint":
-        joint_id = mujoco.mj_name2id(model, mujoco.mjtObj.mjOBJ_JOINT, spec.mj_name)
-        dof_id = model.jnt_dofadr[joint_id]
-        if spec.attribute == "armature":
-            model.dof_armature[dof_id] = value
-        elif spec.attribute == "damping":
-            model.dof_damping[dof_id] = value
-        elif spec.attribute == "frictionloss":
-            model.dof_frictionloss[dof_id] = value
-    elif spec.element == "body":
-        body_id = mujoco.mj_name2id(model, mujoco.mjtObj.mjOBJ_BODY, spec.mj_name)
-        if spec.attribute == "mass":
-            model.body_mass[body_id] = value
-    elif spec.element == "geom":
-        geom_id = mujoco.mj_name2id(model, mujoco.mjtObj.mjOBJ_GEOM, spec.mj_name)
-        if spec.attribute == "friction":
-            model.geom_friction[geom_id, 0] = value
-    elif spec.element == "actuator":
-        act_id = mujoco.mj_name2id(model, mujoco.mjtObj.mjOBJ_ACTUATOR, spec.mj_name)
-        if spec.attribute == "gainprm":
-            model.actuator_gainprm[act_id, 0] = value
+    Raises:
+        ValueError: If the element/attribute combination is unsupported.
+    """
+    array, index = resolve_param(model, spec)
+    array[index] = value
@@ -11,11 +11,12 @@ import json
 import logging
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 import numpy as np
 
 from .trajectory import TrajectoryData
-from .parameters import ParamSpec, get_param, set_param
+from .parameters import ParamSpec, resolve_param
 
 logger = logging.getLogger("luckyrobots.sysid")
 
@@ -67,18 +68,176 @@ def _rollout(model, data, ctrl_sequence: np.ndarray, dt: float) -> tuple[np.ndar
     qpos_traj = np.zeros((T, nq))
     qvel_traj = np.zeros((T, nv))
 
+    # A full reset is required: restoring only qpos/qvel would leave act, time
+    # and the solver warm start from the previous rollout.
     mujoco.mj_resetData(model, data)
-    model.opt.timestep = dt
+    if model.opt.timestep != dt:
+        model.opt.timestep = dt
 
+    # Views into MjData, hoisted out of the loop; rows are copied straight in.
+    ctrl, qpos, qvel = data.ctrl[:nu], data.qpos, data.qvel
+    mj_step = mujoco.mj_step
     for t in range(T):
-        data.ctrl[:nu] = ctrl_sequence[t]
-        mujoco.mj_step(model, data)
-        qpos_traj[t] = data.qpos.copy()
-        qvel_traj[t] = data.qvel.copy()
+        ctrl[:] = ctrl_sequence[t]
+        mj_step(model, data)
+        qpos_traj[t] = qpos
+        qvel_traj[t] = qvel
 
     return qpos_traj, qvel_traj
 
 
+def _group_slots(slots: list) -> list[tuple[np.ndarray, Any, np.ndarray]]:
+    """Group resolved parameter slots by model array for fancy-index writes.
+
+    Returns ``(array, index, positions)`` triples so that
+    ``array[index] = x[positions]`` writes every parameter stored in that
+    array with a single numpy assignment.
+    """
+    groups: dict[int, tuple[np.ndarray, list, list[int]]] = {}
+    for position, (array, index) in enumerate(slots):
+        _, indices, positions = groups.setdefault(id(array), (array, [], []))
+        indices.append(index)
+        positions.append(position)
+
+    writes = []
+    for array, indices, positions in groups.values():
+        if array.ndim == 1:
+            index = np.array(indices, dtype=np.intp)
+        else:
+            index = tuple(np.array(axis, dtype=np.intp) for axis in zip(*indices))
+        writes.append((array, index, np.array(positions, dtype=np.intp)))
+    return writes
+
+
+@dataclass(frozen=True, slots=True)
+class _Reference:
+    """A recorded trajectory pre-sliced to the joints the model simulates."""
+
+    ctrl: np.ndarray
+    dt: float
+    qpos: np.ndarray
+    qvel: np.ndarray
+
+
+def _prepare_references(model, trajectories: list[TrajectoryData]) -> list[_Reference]:
+    """Resolve dt and slice each recording to the compared columns once."""
+    references = []
+    for traj in trajectories:
+        nq_compare = min(model.nq, traj.qpos.shape[1])
+        nv_compare = min(model.nv, traj.qvel.shape[1])
+        references.append(_Reference(
+            ctrl=traj.ctrl,
+            dt=traj.dt,
+            qpos=np.ascontiguousarray(traj.qpos[:, :nq_compare], dtype=np.float64),
+            qvel=np.ascontiguousarray(traj.qvel[:, :nv_compare], dtype=np.float64),
+        ))
+    return references
+
+
+def _residuals(
+    model,
+    data,
+    writes: list[tuple[np.ndarray, Any, np.ndarray]],
+    x: np.ndarray,
+    references: list[_Reference],
+    qpos_weight: float,
+    qvel_weight: float,
+) -> np.ndarray:
+    """Write x into the model and return the stacked weighted tracking error."""
+    for array, index, positions in writes:
+        array[index] = x[positions]
+
+    # Each block is written straight into its slice of one output vector. A
+    # fresh vector per call: scipy keeps earlier residuals (f0 for the
+    # Jacobian, the accepted fun), so a shared buffer would be overwritten.
+    out = np.empty(sum(ref.qpos.size + ref.qvel.size for ref in references))
+    offset = 0
+    for ref in references:
+        sim_qpos, sim_qvel = _rollout(model, data, ref.ctrl, ref.dt)
+
+        blocks = ((sim_qpos, ref.qpos, qpos_weight), (sim_qvel, ref.qvel, qvel_weight))
+        for sim, recorded, weight in blocks:
+            block = out[offset : offset + recorded.size].reshape(recorded.shape)
+            np.subtract(sim[:, : recorded.shape[1]], recorded, out=block)
+            block *= weight
+            offset += recorded.size
+
+    return out
+
+
+# ── Process-pool workers ──
+
+# Per-process (model, data, writes, references, qpos_weight, qvel_weight,
+# probe_out), set by _init_worker so each worker loads the model and
+# references once.
+_worker_state: tuple | None = None
+
+
+def _init_worker(
+    model_xml: str,
+    param_specs: list[ParamSpec],
+    references: list[_Reference],
+    qpos_weight: float,
+    qvel_weight: float,
+    probe_path: str,
+    probe_shape: tuple[int, int],
+) -> None:
+    global _worker_state
+    import mujoco
+
+    model = mujoco.MjModel.from_xml_path(model_xml)
+    data = mujoco.MjData(model)
+    writes = _group_slots([resolve_param(model, spec) for spec in param_specs])
+    probe_out = np.memmap(probe_path, dtype=np.float64, mode="r+", shape=probe_shape)
+    _worker_state = (model, data, writes, references, qpos_weight, qvel_weight, probe_out)
+
+
+def _worker_probe(task: tuple[int, np.ndarray]) -> None:
+    """Evaluate one perturbed x and store its residual in row i of probe_out."""
+    i, x = task
+    model, data, writes, references, qpos_weight, qvel_weight, probe_out = _worker_state
+    probe_out[i] = _residuals(model, data, writes, x, references, qpos_weight, qvel_weight)
+
+
+def _parallel_jacobian(
+    pool,
+    probe_out: np.ndarray,
+    x: np.ndarray,
+    f0: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+) -> np.ndarray:
+    """Forward-difference Jacobian with one pool task per parameter column.
+
+    Uses the same relative step and bound handling as scipy's default
+    ``"2-point"`` scheme, flipping the step inward at an upper/lower bound.
+    Workers write perturbed residuals into the shared ``probe_out`` rows,
+    so only the parameter vectors cross the process boundary.
+    """
+    sign = np.where(x >= 0, 1.0, -1.0)
+    h = _FD_REL_STEP * sign * np.maximum(1.0, np.abs(x))
+    outside = (x + h > upper) | (x + h < lower)
+    h[outside] = -h[outside]
+    h = (x + h) - x
+
+    probes = []
+    for i in range(x.size):
+        xi = x.copy()
+        xi[i] += h[i]
+        probes.append(xi)
+
+    # Drain the iterator: returns once every row has been written.
+    for _ in pool.map(_worker_probe, enumerate(probes)):
+        pass
+
+    jac = np.subtract(probe_out, f0)
+    jac /= h[:, None]
+    return jac.T
+
+
+_FD_REL_STEP = np.finfo(np.float64).eps ** 0.5
+
+
 def identify(
     model_xml: str | Path,
     trajectories: list[TrajectoryData] | TrajectoryData,
@@ -88,6 +247,7 @@ def identify(
     max_iterations: int = 100,
     qpos_weight: float = 1.0,
     qvel_weight: float = 0.1,
+    workers: int = 1,
 ) -> SysIdResult:
     """Run system identification.
 
@@ -103,6 +263,10 @@ def identify(
         max_iterations: Maximum optimization iterations.
         qpos_weight: Weight for position error in residual.
         qvel_weight: Weight for velocity error in residual.
+        workers: Number of worker processes for the finite-difference
+            Jacobian. Each worker loads its own copy of the model and
+            evaluates one perturbed parameter vector per task; ``1`` keeps
+            everything in this process.
 
     Returns:
         SysIdResult with identified parameters and diagnostics.
@@ -117,13 +281,18 @@ def identify(
     model = mujoco.MjModel.from_xml_path(str(model_xml))
     data = mujoco.MjData(model)
 
+    # Resolve each parameter's storage once; the optimizer writes through these.
+    slots = [resolve_param(model, spec) for spec in param_specs]
+    writes = _group_slots(slots)
+    references = _prepare_references(model, trajectories)
+
     # Read initial parameter values
     initial_params = {}
     x0 = []
     bounds_lo = []
     bounds_hi = []
-    for spec in param_specs:
-        val = get_param(model, spec)
+    for spec, (array, index) in zip(param_specs, slots):
+        val = float(array[index])
         initial_params[spec.name] = val
         x0.append(val)
         bounds_lo.append(spec.min_value)
@@ -131,38 +300,64 @@ def identify(
 
     x0 = np.array(x0)
 
-    def residual_fn(x: np.ndarray) -> np.ndarray:
-        for i, spec in enumerate(param_specs):
-            set_param(model, spec, x[i])
-
-        all_residuals = []
-        for traj in trajectories:
-            dt = traj.dt
-            sim_qpos, sim_qvel = _rollout(model, data, traj.ctrl, dt)
+    # Last evaluated (x, residual); scipy always evaluates fun(x) before jac(x).
+    last_eval: list = [None, None]
 
-            nq_compare = min(sim_qpos.shape[1], traj.qpos.shape[1])
-            nv_compare = min(sim_qvel.shape[1], traj.qvel.shape[1])
-
-            qpos_err = (sim_qpos[:, :nq_compare] - traj.qpos[:, :nq_compare]) * qpos_weight
-            qvel_err = (sim_qvel[:, :nv_compare] - traj.qvel[:, :nv_compare]) * qvel_weight
-
-            all_residuals.append(qpos_err.ravel())
-            all_residuals.append(qvel_err.ravel())
-
-        return np.concatenate(all_residuals)
+    def residual_fn(x: np.ndarray) -> np.ndarray:
+        f = _residuals(model, data, writes, x, references, qpos_weight, qvel_weight)
+        last_eval[:] = [x.copy(), f]
+        return f
 
     # Compute initial residual
     residual_before = float(np.sum(residual_fn(x0) ** 2))
 
     # Run optimization
-    result = scipy_lsq(
-        residual_fn,
-        x0,
+    lsq_kwargs = dict(
         bounds=(bounds_lo, bounds_hi),
         max_nfev=max_iterations,
         method="trf",
+        x_scale="jac",
         verbose=1,
     )
+    if workers > 1:
+        import tempfile
+        from concurrent.futures import ProcessPoolExecutor
+
+        lower, upper = np.asarray(bounds_lo, float), np.asarray(bounds_hi, float)
+
+        # File-backed shared buffer with one row per Jacobian probe; the
+        # residual vectors (T * (nq + nv) floats each) never get pickled.
+        with tempfile.TemporaryDirectory(prefix="luckyrobots-sysid-") as tmp_dir:
+            probe_path = str(Path(tmp_dir) / "probes.dat")
+            probe_shape = (len(param_specs), last_eval[1].size)
+            probe_out = np.memmap(probe_path, dtype=np.float64, mode="w+", shape=probe_shape)
+
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_worker,
+                    initargs=(
+                        str(model_xml), param_specs, references, qpos_weight, qvel_weight,
+                        probe_path, probe_shape,
+                    ),
+                ) as pool:
+
+                    def jac_fn(x: np.ndarray) -> np.ndarray:
+                        cached_x, f0 = last_eval
+                        if cached_x is None or not np.array_equal(cached_x, x):
+                            f0 = residual_fn(x)
+                        return _parallel_jacobian(pool, probe_out, x, f0, lower, upper)
+
+                    result = scipy_lsq(residual_fn, x0, jac=jac_fn, **lsq_kwargs)
+            finally:
+                # Unmap before the temp dir is removed, also when a worker raised:
+                # Windows refuses to delete a file that is still mapped, which
+                # would mask the original error. jac_fn's closure still holds
+                # probe_out, so dropping the name alone would not release it.
+                probe_out._mmap.close()
+                del probe_out
+    else:
+        result = scipy_lsq(residual_fn, x0, **lsq_kwargs)
 
     residual_after = float(np.sum(result.fun ** 2))
 
@@ -205,10 +400,16 @@ def _compute_confidence(result, param_specs: list[ParamSpec]) -> dict[str, tuple
         n_residuals = len(residuals)
         n_params = len(param_specs)
         if n_residuals > n_params:
+            from scipy.linalg import solve_triangular
+
             sigma2 = np.sum(residuals ** 2) / (n_residuals - n_params)
-            cov = sigma2 * np.linalg.inv(J.T @ J)
+            # diag((J^T J)^-1) = row norms of R^-1 for J = QR; avoids forming J^T J.
+            # mode="r" skips Q and returns only the (n_params, n_params) triangle.
+            R = np.linalg.qr(J, mode="r")
+            R_inv = solve_triangular(R, np.eye(n_params), check_finite=False)
+            var = sigma2 * np.sum(R_inv ** 2, axis=1)
             for i, spec in enumerate(param_specs):
-                std = np.sqrt(max(cov[i, i], 0.0))
+                std = np.sqrt(max(var[i], 0.0))
                 confidence[spec.name] = (
                     float(result.x[i] - 1.96 * std),
                     float(result.x[i] + 1.96 * std),
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -48,21 +49,57 @@ class TrajectoryData:
         return len(self.times)
 
     def save(self, path: str | Path) -> Path:
-        """Save trajectory to .npz file."""
+        """Save trajectory to disk.
+
+        A path ending in ``.npz`` writes a single NumPy archive. Any other
+        path is created as a directory holding one ``.npy`` file per array
+        plus ``metadata.json``, which :meth:`load` can memory-map.
+
+        Args:
+            path: Output ``.npz`` file or directory.
+
+        Returns:
+            The path written.
+        """
         path = Path(path)
-        np.savez(
-            path,
-            times=self.times,
-            qpos=self.qpos,
-            qvel=self.qvel,
-            ctrl=self.ctrl,
-            metadata=np.array([self.metadata]),
-        )
+        if path.suffix == ".npz":
+            np.savez(
+                path,
+                times=self.times,
+                qpos=self.qpos,
+                qvel=self.qvel,
+                ctrl=self.ctrl,
+                metadata=np.array([self.metadata]),
+            )
+            return path
+
+        path.mkdir(parents=True, exist_ok=True)
+        for name in _ARRAY_FIELDS:
+            np.save(path / f"{name}.npy", getattr(self, name))
+        (path / "metadata.json").write_text(json.dumps(self.metadata, default=str))
         return path
 
     @classmethod
-    def load(cls, path: str | Path) -> TrajectoryData:
-        """Load trajectory from .npz file."""
+    def load(cls, path: str | Path, mmap_mode: str | None = "r") -> TrajectoryData:
+        """Load trajectory from a ``.npy`` directory or a ``.npz`` file.
+
+        Args:
+            path: Directory written by :meth:`save`, or a ``.npz`` archive.
+            mmap_mode: Memory-map mode for ``.npy`` directories (see
+                ``np.load``); pages are read lazily as they are accessed.
+                ``None`` reads the arrays fully into memory. Ignored for
+                ``.npz`` archives, which cannot be memory-mapped.
+        """
+        path = Path(path)
+        if path.is_dir():
+            arrays = {
+                name: np.load(path / f"{name}.npy", mmap_mode=mmap_mode)
+                for name in _ARRAY_FIELDS
+            }
+            metadata_path = path / "metadata.json"
+            metadata = json.loads(metadata_path.read_text()) if metadata_path.exists() else {}
+            return cls(**arrays, metadata=metadata)
+
         data = np.load(path, allow_pickle=True)
         metadata = data["metadata"].item() if "metadata" in data else {}
         return cls(
@@ -91,15 +128,26 @@ class TrajectoryData:
         """
         import csv
 
+        def as_list(keys: str | list[str]) -> list[str]:
+            return [keys] if isinstance(keys, str) else list(keys)
+
         path = Path(path)
-        with open(path) as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+        with open(path, newline="") as f:
+            header = next(csv.reader(f), [])
+            # Later duplicates win, as with csv.DictReader.
+            header_index = {name: i for i, name in enumerate(header)}
+            wanted = [k for keys in column_map.values() for k in as_list(keys)]
+            for name in wanted:
+                if name not in header_index:
+                    raise KeyError(name)
+            usecols = sorted({header_index[name] for name in wanted})
+            # Numeric body parsed in C; only the referenced columns are converted.
+            table = np.loadtxt(f, delimiter=",", usecols=usecols, ndmin=2, dtype=np.float64)
+        position = {col: i for i, col in enumerate(usecols)}
+        n_rows = table.shape[0]
 
         def extract(keys: str | list[str]) -> np.ndarray:
-            if isinstance(keys, str):
-                keys = [keys]
-            return np.array([[float(row[k]) for k in keys] for row in rows])
+            return table[:, [position[header_index[k]] for k in as_list(keys)]]
 
         qpos = extract(column_map["qpos"])
         qvel = extract(column_map["qvel"])
@@ -108,7 +156,7 @@ class TrajectoryData:
         if "time" in column_map:
             times = extract(column_map["time"]).squeeze()
         elif dt is not None:
-            times = np.arange(len(rows)) * dt
+            times = np.arange(n_rows) * dt
         else:
             raise ValueError("Either 'time' column_map key or dt must be provided")
 
@@ -119,3 +167,7 @@ class TrajectoryData:
             ctrl=ctrl,
             metadata={"source": str(path)},
         )
+
+
+# Array fields stored one-per-file by TrajectoryData.save().
+_ARRAY_FIELDS = ("times", "qpos", "qvel", "ctrl")
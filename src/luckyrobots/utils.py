@@ -1,26 +1,74 @@
 """Utility functions for LuckyRobots."""
 
-import yaml
+import copy
+import functools
 import importlib.resources
+import pathlib
+import threading
+from typing import Optional
+
+# Parsed YAML resources keyed by resource path, with the (mtime_ns, size) they were
+# read at, or None for resources that are not plain files (zip installs).
+_CONFIG_CACHE: dict[str, tuple[Optional[tuple[int, int]], dict]] = {}
+_CONFIG_LOCK = threading.Lock()
+
+
+@functools.cache
+def _yaml_loader():
+    """Import PyYAML on first use and pick the libyaml-backed loader if present.
+
+    Deferred so ``import luckyrobots`` does not pay for PyYAML.
+    """
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader as loader
+    return loader
+
+
+def _load_yaml_resource(relative_path: str) -> dict:
+    """Parse a packaged YAML file, reusing the last parse while the file is unchanged.
+
+    Plain files are re-validated by (mtime, size) on every call. Resources inside
+    a zip archive cannot change while the process runs, so they are parsed once.
+    """
+    resource = importlib.resources.files("luckyrobots").joinpath(relative_path)
+    signature = None
+    if isinstance(resource, pathlib.Path):
+        st = resource.stat()
+        signature = (st.st_mtime_ns, st.st_size)
+    key = str(resource)
+
+    with _CONFIG_LOCK:
+        cached = _CONFIG_CACHE.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        import yaml
+
+        with resource.open("r") as f:
+            config = yaml.load(f, Loader=_yaml_loader())
+        _CONFIG_CACHE[key] = (signature, config)
+        return config
 
 
 def get_robot_config(robot: str = None) -> dict:
     """Get the configuration for a robot from robots.yaml.
 
+    The parsed file is cached and re-read only when its mtime or size changes.
+    Callers receive a copy, so mutating the result does not affect the cache.
+
     Args:
         robot: Robot name. If None, returns entire config.
 
     Returns:
         Robot configuration dict, or full config if robot is None.
     """
-    with importlib.resources.files("luckyrobots").joinpath("config/robots.yaml").open(
-        "r"
-    ) as f:
-        config = yaml.safe_load(f)
-        if robot is not None:
-            return config[robot]
-        else:
-            return config
+    config = _load_yaml_resource("config/robots.yaml")
+    if robot is not None:
+        return copy.deepcopy(config[robot])
+    else:
+        return copy.deepcopy(config)
 
 
 def validate_params(
@@ -49,7 +97,8 @@ def validate_params(
     if observation_type is None:
         raise ValueError("Observation type is required")
 
-    robot_config = get_robot_config(robot)
+    # Read-only lookup, so use the cached parse directly rather than a copy.
+    robot_config = _load_yaml_resource("config/robots.yaml")[robot]
 
     if scene not in robot_config["available_scenes"]:
         raise ValueError(f"Scene {scene} not available in {robot} config")
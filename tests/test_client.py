@@ -5,6 +5,7 @@ Note: Tests marked with @pytest.mark.integration require a running LuckyEngine s
 Run with: pytest -m integration
 """
 
+import numpy as np
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -34,6 +35,51 @@ class TestLuckyEngineClientUnit:
         assert client.host == "192.168.1.100"
         assert client.port == 50052
 
+    def test_channel_options_override_defaults(self):
+        """Test caller channel options are merged over the defaults."""
+        client = LuckyEngineClient(
+            robot_name="test_robot",
+            channel_options=[("grpc.max_receive_message_length", 1024)],
+        )
+
+        options = dict(client._channel_options)
+        assert options["grpc.max_receive_message_length"] == 1024
+        assert "grpc.keepalive_time_ms" in options
+
+    def test_shared_channel_is_refcounted(self):
+        """Test clients with shared_channel=True reuse and refcount one channel."""
+        a = LuckyEngineClient(port=50999, shared_channel=True)
+        b = LuckyEngineClient(port=50999, shared_channel=True)
+        a.connect()
+        b.connect()
+        try:
+            assert a.channel is b.channel
+
+            a.close()
+            assert not a.is_connected()
+            assert b.is_connected()
+
+            c = LuckyEngineClient(port=50999, shared_channel=True)
+            c.connect()
+            assert c.channel is b.channel
+            c.close()
+        finally:
+            b.close()
+
+        from luckyrobots import client as client_module
+
+        assert client_module._SHARED_CHANNELS == {}
+
+    def test_polled_requests_cached_for_default_robot_only(self):
+        """Test request reuse is limited to the default robot's messages."""
+        client = LuckyEngineClient(robot_name="go2")
+
+        req = client._joint_state_request("go2")
+        other = client._joint_state_request("arm")
+
+        assert client._joint_state_request("go2") is req
+        assert client._joint_state_request("arm") is not other
+
     def test_schema_cache_initialized(self):
         """Test schema cache is initialized empty."""
         client = LuckyEngineClient(robot_name="test_robot")
@@ -54,6 +100,163 @@ class TestLuckyEngineClientUnit:
         with pytest.raises(ValueError, match="Unknown method"):
             client.benchmark(method="invalid_method")
 
+    def test_step_builds_action_groups_in_request(self):
+        """Test step() adds valid action groups to the StepRequest and skips invalid ones."""
+        from luckyrobots.grpc.generated import agent_pb2
+
+        client = LuckyEngineClient(robot_name="test_robot")
+        client._agent = MagicMock()
+        client._agent.Step.return_value = agent_pb2.StepResponse(success=True)
+
+        client.step(
+            actions=[0.1, 0.2],
+            action_groups=[
+                {"group_name": "arm", "actions": [1.0], "action_indices": [3]},
+                {"group_name": "", "actions": [1.0], "action_indices": [4]},
+            ],
+        )
+
+        request = client._agent.Step.call_args.args[0]
+        assert list(request.actions) == pytest.approx([0.1, 0.2])
+        assert len(request.action_groups) == 1
+        assert request.action_groups[0].group_name == "arm"
+        assert list(request.action_groups[0].action_indices) == [3]
+
+    def test_stream_camera_frames_keep_call_controls(self):
+        """Test as_camera_frames yields CameraFrames and forwards cancel() to the call."""
+        from luckyrobots import CameraFrame
+        from luckyrobots.grpc.generated import media_pb2
+
+        frame = media_pb2.ImageFrame(data=bytes(12), width=2, height=2, channels=3)
+        call = MagicMock()
+        call.__next__.side_effect = [frame, StopIteration]
+        client = LuckyEngineClient(robot_name="test_robot")
+        client._camera = MagicMock()
+        client._camera.StreamCamera.return_value = call
+
+        stream = client.stream_camera(name="HeadCam", as_camera_frames=True)
+        frames = list(stream)
+        stream.cancel()
+
+        assert len(frames) == 1 and isinstance(frames[0], CameraFrame)
+        assert frames[0].name == "HeadCam"
+        assert frames[0].image.shape == (2, 2, 3)
+        call.cancel.assert_called_once_with()
+
+    def test_wait_for_server_respects_deadline(self):
+        """Test wait_for_server() gives up at its deadline when nothing is listening."""
+        import time
+
+        client = LuckyEngineClient(host="127.0.0.1", port=1, timeout=5.0)
+        start = time.perf_counter()
+        try:
+            assert client.wait_for_server(timeout=0.3, poll_interval=0.1) is False
+        finally:
+            client.close()
+
+        assert time.perf_counter() - start < 1.0
+
+    def test_step_accepts_numpy_actions(self):
+        """Test step() converts NumPy action arrays into the request."""
+        from luckyrobots.grpc.generated import agent_pb2
+
+        client = LuckyEngineClient(robot_name="test_robot")
+        client._agent = MagicMock()
+        client._agent.Step.return_value = agent_pb2.StepResponse(success=True)
+
+        client.step(actions=np.array([0.25, -0.5], dtype=np.float32))
+
+        request = client._agent.Step.call_args.args[0]
+        assert list(request.actions) == [0.25, -0.5]
+
+    def test_async_step_accepts_numpy_actions(self):
+        """Test AsyncSession.step() converts NumPy action arrays into the request."""
+        import asyncio
+
+        from luckyrobots import AsyncSession
+        from luckyrobots.grpc.generated import agent_pb2
+
+        session = AsyncSession()
+        session._channel = MagicMock()
+        session._agent = MagicMock()
+
+        async def fake_step(request, timeout=None):
+            return agent_pb2.StepResponse(success=True)
+
+        session._agent.Step.side_effect = fake_step
+
+        asyncio.run(session.step(actions=np.array([0.25, -0.5], dtype=np.float32)))
+
+        request = session._agent.Step.call_args.args[0]
+        assert list(request.actions) == [0.25, -0.5]
+
+
+class TestSessionReset:
+    """Tests for Session.reset() without a server."""
+
+    def test_reset_queries_agent_schema_once(self):
+        """Test the zero-action vector is cached per agent across resets."""
+        from luckyrobots import Session
+
+        session = Session()
+        client = MagicMock()
+        client.reset_agent.return_value = MagicMock(success=True)
+        client.get_agent_schema.return_value.schema.action_size = 3
+        session._engine_client = client
+
+        session.reset()
+        session.reset()
+
+        client.get_agent_schema.assert_called_once_with(agent_name="")
+        assert client.step.call_args.kwargs["actions"] == [0.0, 0.0, 0.0]
+
+
+class TestSessionReuseEngine:
+    """Tests for Session.start(reuse_engine=True) lifecycle."""
+
+    def test_exit_leaves_attached_engine_running(self, monkeypatch):
+        """Test leaving the context does not stop an engine the session only attached to."""
+        from luckyrobots import Session
+        from luckyrobots import session as session_module
+
+        launch = MagicMock()
+        stop = MagicMock()
+        monkeypatch.setattr(session_module, "is_luckyengine_running", lambda: True)
+        monkeypatch.setattr(session_module, "launch_luckyengine", launch)
+        monkeypatch.setattr(session_module, "stop_luckyengine", stop)
+        monkeypatch.setattr(Session, "connect", MagicMock())
+        monkeypatch.setattr(Session, "_wait_for_agents_ready", MagicMock())
+
+        with Session() as session:
+            session.start(scene="s", robot="unitreego2", task="t", reuse_engine=True)
+
+        launch.assert_not_called()
+        stop.assert_not_called()
+
+
+class TestLuckyEnvStep:
+    """Tests for LuckyEnv.step() without a server."""
+
+    def test_step_returns_writable_observation(self):
+        """Test the env hands out a writable copy of the read-only response array."""
+        from luckyrobots import LuckyEnv
+
+        env = LuckyEnv.__new__(LuckyEnv)
+        env._step_count = 0
+        env._agent_name = ""
+        env._reward_fn = LuckyEnv._default_reward_fn
+        env._client = MagicMock()
+        response = ObservationResponse(
+            observation=[1.0, 2.0], actions=[0.0], timestamp_ms=0, frame_number=0, agent_name=""
+        )
+        env._client.step.return_value = response
+
+        obs, *_ = env.step(np.zeros(1, dtype=np.float32))
+        obs -= 1.0
+
+        assert obs.tolist() == [0.0, 1.0]
+        assert response.observation.tolist() == [1.0, 2.0]
+
 
 class TestObservationResponse:
     """Tests for ObservationResponse model."""
@@ -68,12 +271,23 @@ class TestObservationResponse:
             agent_name="agent_0",
         )
 
-        assert obs.observation == [1.0, 2.0, 3.0]
-        assert obs.actions == [0.5, 0.5]
+        assert obs.observation.tolist() == [1.0, 2.0, 3.0]
+        assert obs.observation.dtype == np.float32
+        assert obs.actions.tolist() == [0.5, 0.5]
         assert obs.timestamp_ms == 12345
         assert obs.frame_number == 100
         assert obs.agent_name == "agent_0"
 
+    def test_observation_response_value_equality(self):
+        """Test responses compare by value and expose read-only arrays."""
+        kwargs = dict(actions=[0.5], timestamp_ms=1, frame_number=2, agent_name="agent_0")
+        obs = ObservationResponse(observation=[1.0, 2.0], **kwargs)
+
+        assert obs == ObservationResponse(observation=[1.0, 2.0], **kwargs)
+        assert obs != ObservationResponse(observation=[1.0, 3.0], **kwargs)
+        with pytest.raises(ValueError):
+            obs.observation[0] = 5.0
+
     def test_observation_response_named_access(self):
         """Test named access to observations."""
         obs = ObservationResponse(
@@ -85,9 +299,10 @@ class TestObservationResponse:
             observation_names=["x", "y", "z"],
         )
 
-        assert obs["x"] == 0.1
-        assert obs["y"] == 0.2
-        assert obs["z"] == 0.3
+        assert obs["x"] == pytest.approx(0.1)
+        assert obs["y"] == pytest.approx(0.2)
+        assert obs["z"] == pytest.approx(0.3)
+        assert isinstance(obs["x"], float)
 
     def test_observation_response_get_with_default(self):
         """Test get() method with default value."""
@@ -116,6 +331,22 @@ class TestObservationResponse:
 
         assert obs.to_dict() == {"a": 1.0, "b": 2.0}
 
+    def test_observation_response_to_dict_is_isolated(self):
+        """Test mutating a to_dict() result does not leak into later calls."""
+        obs = ObservationResponse(
+            observation=[1.0, 2.0],
+            actions=[],
+            timestamp_ms=0,
+            frame_number=0,
+            agent_name="agent_0",
+            observation_names=["a", "b"],
+        )
+
+        first = obs.to_dict()
+        first["a"] = 99.0
+        assert obs.to_dict() == {"a": 1.0, "b": 2.0}
+        assert obs["a"] == 1.0
+
     def test_observation_response_to_dict_without_names(self):
         """Test to_dict() without observation names uses indices."""
         obs = ObservationResponse(
@@ -141,6 +372,33 @@ class TestObservationResponse:
         with pytest.raises(KeyError, match="No observation names available"):
             _ = obs["x"]
 
+    def test_observation_response_from_proto(self):
+        """Test from_proto() copies fields out of a StepResponse."""
+        from luckyrobots.grpc.generated import agent_pb2
+
+        resp = agent_pb2.StepResponse(
+            success=True,
+            observation=agent_pb2.AgentFrame(
+                timestamp_ms=42, frame_number=7, observations=[0.5, 1.5], actions=[0.25]
+            ),
+            terminated=True,
+            reward_signals={"alive": 1.0},
+        )
+
+        obs = ObservationResponse.from_proto(
+            resp, agent_name="agent_0", observation_names=["a", "b"]
+        )
+
+        assert obs.observation.tolist() == [0.5, 1.5]
+        assert obs.actions.tolist() == [0.25]
+        assert obs.timestamp_ms == 42
+        assert obs.frame_number == 7
+        assert obs["b"] == 1.5
+        assert obs.terminated is True
+        assert obs.reward_signals == {"alive": 1.0}
+        assert obs.info is None
+        assert obs.camera_frames == []
+
     def test_actions_to_dict(self):
         """Test actions_to_dict() conversion."""
         obs = ObservationResponse(
@@ -152,7 +410,26 @@ class TestObservationResponse:
             action_names=["motor_0", "motor_1"],
         )
 
-        assert obs.actions_to_dict() == {"motor_0": 0.5, "motor_1": 0.6}
+        assert obs.actions_to_dict() == pytest.approx({"motor_0": 0.5, "motor_1": 0.6})
+
+
+class TestCameraFrame:
+    """Tests for CameraFrame dataclass."""
+
+    def test_image_is_zero_copy_view(self):
+        """Test image returns a read-only (H, W, C) view over the raw bytes."""
+        from luckyrobots.models import CameraFrame
+
+        data = bytes(range(2 * 3 * 4))
+        frame = CameraFrame(
+            name="cam", data=data, width=3, height=2, channels=4, frame_number=1
+        )
+
+        img = frame.image
+        assert img.shape == (2, 3, 4)
+        assert img[1, 2, 3] == 23
+        assert not img.flags.writeable
+        assert img.base is not None
 
 
 class TestBenchmarkResult:
@@ -218,7 +495,7 @@ class TestLuckyEngineClientIntegration:
         """Test stepping with zero actions returns observation."""
         obs = client.step(actions=[0.0] * 12)
         assert isinstance(obs, ObservationResponse)
-        assert isinstance(obs.observation, list)
+        assert isinstance(obs.observation, np.ndarray)
 
     def test_get_joint_state(self, client):
         """Test fetching joint state."""
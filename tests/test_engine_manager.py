@@ -0,0 +1,91 @@
+"""
+Tests for LuckyEngine lock-file handling in the engine manager.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from luckyrobots.engine import manager
+
+
+@pytest.fixture
+def lock_file(tmp_path, monkeypatch):
+    """Point the manager at a throwaway lock file."""
+    path = tmp_path / "luckyengine_lock"
+    monkeypatch.setattr(manager, "LOCK_FILE", str(path))
+    return path
+
+
+class TestEngineProcessIsRunning:
+    """Tests for EngineProcess.is_running()."""
+
+    def test_no_lock_file(self, lock_file):
+        """Test no lock file means not running."""
+        assert not manager.EngineProcess().is_running()
+
+    def test_stale_lock_file_is_removed(self, lock_file):
+        """Test a lock file pointing at a dead PID is treated as stale."""
+        proc = subprocess.Popen([sys.executable, "-c", "pass"])
+        proc.wait()
+        lock_file.write_text(str(proc.pid))
+
+        assert not manager.EngineProcess().is_running()
+        assert not lock_file.exists()
+
+    def test_lock_file_for_live_engine(self, lock_file):
+        """Test a lock file pointing at a live LuckyEngine process is honored."""
+        proc = subprocess.Popen(
+            [sys.executable, "-c", "import time; time.sleep(30)", "LuckyEngine"]
+        )
+        try:
+            lock_file.write_text(str(proc.pid))
+            assert manager.EngineProcess().is_running()
+            assert lock_file.exists()
+            # Second poll goes through the verified-PID cache.
+            assert manager.EngineProcess().is_running()
+        finally:
+            proc.kill()
+            proc.wait()
+
+    @pytest.mark.skipif(not manager._HAS_FCNTL, reason="flock is POSIX-only")
+    def test_held_flock_means_running(self, lock_file):
+        """Test a held flock reports running regardless of the recorded PID."""
+        import fcntl
+
+        lock_file.write_text("999999999")
+        with open(lock_file) as holder:
+            fcntl.flock(holder, fcntl.LOCK_EX)
+            assert manager.EngineProcess().is_running()
+
+        # Lock released and the recorded PID is dead: stale.
+        assert not manager.EngineProcess().is_running()
+        assert not lock_file.exists()
+
+    @pytest.mark.skipif(not manager._HAS_FCNTL, reason="flock is POSIX-only")
+    def test_stop_leaves_foreign_lock(self, lock_file):
+        """Test stop() keeps a lock held by another launcher this instance doesn't own."""
+        import fcntl
+
+        lock_file.write_text("999999999")
+        with open(lock_file) as holder:
+            fcntl.flock(holder, fcntl.LOCK_EX)
+            assert not manager.EngineProcess().stop()
+            assert lock_file.exists()
+            assert manager.EngineProcess().is_running()
+
+    @pytest.mark.skipif(not manager._HAS_FCNTL, reason="flock is POSIX-only")
+    def test_lock_file_round_trip(self, lock_file):
+        """Test acquiring, writing and removing the launcher's lock file."""
+        fd = manager._acquire_lock_file()
+        try:
+            manager._create_lock_file(4321)
+            assert lock_file.read_text() == "4321"
+            assert manager._lock_file_is_held()
+        finally:
+            manager._remove_lock_file()
+
+        assert manager._lock_fd is None
+        assert not lock_file.exists()
+        assert fd is not None
@@ -0,0 +1,47 @@
+"""
+Tests for the SimulationContract proto builder.
+"""
+
+from luckyrobots import DomainRandomizationConfig
+from luckyrobots.grpc.generated import agent_pb2
+from luckyrobots.sim_contract import to_proto
+
+
+class TestDomainRandomizationConfig:
+    """Tests for DomainRandomizationConfig and to_proto()."""
+
+    def test_only_set_fields_are_serialized(self):
+        """Test unset fields stay at proto defaults."""
+        cfg = DomainRandomizationConfig(
+            friction_range=(0.5, 1.5),
+            joint_position_noise=0.01,
+            terrain_type="rough",
+        )
+
+        msg = cfg.to_proto(agent_pb2)
+
+        assert list(msg.friction_range) == [0.5, 1.5]
+        assert abs(msg.joint_position_noise - 0.01) < 1e-6
+        assert msg.terrain_type == "rough"
+        assert list(msg.mass_scale_range) == []
+        assert msg.terrain_difficulty == 0.0
+
+    def test_default_valued_scalars_are_skipped(self):
+        """Test the method and module serializers agree on default-valued scalars."""
+        cfg = DomainRandomizationConfig(terrain_difficulty=0.0, terrain_type="")
+
+        assert cfg.to_proto(agent_pb2) == to_proto(agent_pb2, cfg)
+        assert cfg.to_proto(agent_pb2).ByteSize() == 0
+
+    def test_empty_config_produces_empty_contract(self):
+        """Test a default config serializes to an empty message."""
+        msg = to_proto(agent_pb2, DomainRandomizationConfig())
+
+        assert msg.ByteSize() == 0
+
+    def test_mapping_config_is_serialized(self):
+        """Test dict configs (as passed by LuckyEnv) populate the contract."""
+        msg = to_proto(agent_pb2, {"vel_command_x_range": [-1.0, 1.0], "terrain_type": ""})
+
+        assert list(msg.vel_command_x_range) == [-1.0, 1.0]
+        assert msg.terrain_type == ""
@@ -0,0 +1,168 @@
+"""
+Tests for system identification parameter access and fitting.
+"""
+
+import numpy as np
+import pytest
+
+mujoco = pytest.importorskip("mujoco")
+
+from luckyrobots.sysid import (  # noqa: E402
+    ParamSpec,
+    TrajectoryData,
+    chirp,
+    get_param,
+    identify,
+    multisine,
+    set_param,
+)
+
+MODEL_XML = """<mujoco>
+  <worldbody>
+    <body name="arm">
+      <joint name="hinge_joint" type="hinge" damping="0.5"/>
+      <geom name="rod" type="capsule" fromto="0 0 0 0.3 0 0" size="0.02" mass="1"/>
+    </body>
+  </worldbody>
+  <actuator>
+    <motor name="hinge_motor" joint="hinge_joint"/>
+  </actuator>
+</mujoco>
+"""
+
+
+@pytest.fixture
+def model():
+    return mujoco.MjModel.from_xml_string(MODEL_XML)
+
+
+class TestParamAccess:
+    """Tests for get_param() / set_param()."""
+
+    def test_round_trip(self, model):
+        """Test set_param writes through to the values get_param reads."""
+        damping = ParamSpec("hinge_damping", "joint", "hinge_joint", "damping", 0.1, 0.0, 1.0)
+        friction = ParamSpec("rod_friction", "geom", "rod", "friction", 1.0, 0.1, 3.0)
+
+        assert get_param(model, damping) == pytest.approx(0.5)
+        set_param(model, damping, 0.25)
+        set_param(model, friction, 2.0)
+
+        assert model.dof_damping[0] == pytest.approx(0.25)
+        assert get_param(model, friction) == pytest.approx(2.0)
+
+    def test_unknown_element_raises(self, model):
+        """Test a missing element name raises instead of writing elsewhere."""
+        spec = ParamSpec("x_damping", "joint", "missing_joint", "damping", 0.1, 0.0, 1.0)
+
+        with pytest.raises(ValueError, match="not found"):
+            set_param(model, spec, 0.3)
+
+
+class TestIdentify:
+    """Tests for identify()."""
+
+    @pytest.fixture
+    def recorded(self, tmp_path):
+        """Record a trajectory at damping=0.5 and write a model starting at 0.2."""
+        true_model = mujoco.MjModel.from_xml_string(MODEL_XML)
+        true_model.opt.timestep = 0.01
+        data = mujoco.MjData(true_model)
+        ctrl = chirp(1.0, 0.01, amplitude=1.0, num_joints=1)
+        qpos, qvel = [], []
+        for row in ctrl:
+            data.ctrl[:] = row
+            mujoco.mj_step(true_model, data)
+            qpos.append(data.qpos.copy())
+            qvel.append(data.qvel.copy())
+        traj = TrajectoryData(
+            times=np.arange(len(ctrl)) * 0.01,
+            qpos=np.array(qpos),
+            qvel=np.array(qvel),
+            ctrl=ctrl,
+        )
+        model_path = tmp_path / "model.xml"
+        model_path.write_text(MODEL_XML.replace('damping="0.5"', 'damping="0.2"'))
+        return model_path, traj
+
+    def test_recovers_damping(self, recorded):
+        """Test the fit moves damping from the model value to the recorded one."""
+        model_path, traj = recorded
+        spec = ParamSpec("hinge_damping", "joint", "hinge_joint", "damping", 0.2, 0.01, 2.0)
+
+        result = identify(model_path, traj, [spec], max_iterations=20)
+
+        assert result.initial_params["hinge_damping"] == pytest.approx(0.2)
+        assert result.params["hinge_damping"] == pytest.approx(0.5, rel=1e-3)
+        assert result.residual_after < result.residual_before
+
+    def test_workers_match_serial_fit(self, recorded):
+        """Test the process-pool Jacobian reproduces the serial result."""
+        model_path, traj = recorded
+        spec = ParamSpec("hinge_damping", "joint", "hinge_joint", "damping", 0.2, 0.01, 2.0)
+
+        serial = identify(model_path, traj, [spec], max_iterations=5)
+        pooled = identify(model_path, traj, [spec], max_iterations=5, workers=2)
+
+        assert pooled.params["hinge_damping"] == pytest.approx(serial.params["hinge_damping"])
+
+
+class TestTrajectoryData:
+    """Tests for TrajectoryData I/O."""
+
+    def test_from_csv_selects_mapped_columns(self, tmp_path):
+        """Test from_csv picks columns by name, in column_map order."""
+        path = tmp_path / "traj.csv"
+        path.write_text("t,b,a,u,note\n0.0,1.0,2.0,0.5,7\n0.1,1.5,2.5,0.25,8\n")
+
+        traj = TrajectoryData.from_csv(
+            path, {"time": "t", "qpos": ["a", "b"], "qvel": "b", "ctrl": "u"}
+        )
+
+        np.testing.assert_array_equal(traj.times, [0.0, 0.1])
+        np.testing.assert_array_equal(traj.qpos, [[2.0, 1.0], [2.5, 1.5]])
+        assert traj.qvel.shape == (2, 1)
+        np.testing.assert_array_equal(traj.ctrl[:, 0], [0.5, 0.25])
+
+    @pytest.mark.parametrize("name", ["traj", "traj.npz"])
+    def test_save_load_round_trip(self, tmp_path, name):
+        """Test both the .npy directory and legacy .npz layouts round-trip."""
+        traj = TrajectoryData(
+            times=np.arange(3) * 0.1,
+            qpos=np.ones((3, 2)),
+            qvel=np.zeros((3, 2)),
+            ctrl=np.full((3, 1), 0.5),
+            metadata={"robot": "go2"},
+        )
+
+        loaded = TrajectoryData.load(traj.save(tmp_path / name))
+
+        np.testing.assert_array_equal(loaded.qpos, traj.qpos)
+        np.testing.assert_array_equal(loaded.ctrl, traj.ctrl)
+        assert loaded.metadata == {"robot": "go2"}
+
+
+class TestExcitation:
+    """Tests for excitation signal generators."""
+
+    def test_multisine_matches_per_joint_sum(self):
+        """Test multisine equals the per-joint, per-frequency sine sum with seeded phases."""
+        frequencies = [0.5, 2.0]
+        ctrl = multisine(1.0, 0.1, frequencies=frequencies, amplitude=0.4, num_joints=3)
+
+        t = np.linspace(0, 1.0, 10)
+        rng = np.random.default_rng(42)
+        expected = np.zeros((10, 3))
+        for j in range(3):
+            for freq in frequencies:
+                phase = rng.uniform(0, 2 * np.pi)
+                expected[:, j] += 0.4 / 2 * np.sin(2 * np.pi * freq * t + phase)
+
+        np.testing.assert_allclose(ctrl, expected, atol=1e-12)
+
+    def test_multisine_without_frequencies_is_zero(self):
+        """Test an empty frequency list yields an all-zero signal."""
+        ctrl = multisine(1.0, 0.1, frequencies=[], num_joints=4)
+
+        assert ctrl.shape == (10, 4)
+        assert not ctrl.any()
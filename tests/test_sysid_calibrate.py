@@ -0,0 +1,55 @@
+"""
+Tests for applying identified parameters to MuJoCo XML models.
+"""
+
+import xml.etree.ElementTree as ET
+
+from luckyrobots.sysid import SysIdResult, apply_params
+
+MODEL_XML = """<mujoco>
+  <worldbody>
+    <body name="trunk">
+      <inertial mass="1"/>
+      <geom name="foot" friction="0.8 0.01 0.001"/>
+      <joint name="hip_joint"/>
+      <joint name="hip_joint"/>
+    </body>
+  </worldbody>
+</mujoco>
+"""
+
+
+def _result(params):
+    return SysIdResult(
+        params=params,
+        initial_params={},
+        confidence={},
+        residual_before=0.0,
+        residual_after=0.0,
+    )
+
+
+class TestApplyParams:
+    """Tests for apply_params()."""
+
+    def test_params_are_written_to_matching_elements(self, tmp_path):
+        """Test joint, body and geom params land on the first matching element."""
+        model = tmp_path / "model.xml"
+        model.write_text(MODEL_XML)
+        params = {
+            "hip_damping": 0.3,
+            "hip_armature": 0.02,
+            "trunk_mass": 5.0,
+            "foot_friction": 1.2,
+            "unknown_mass": 9.0,
+        }
+
+        out = apply_params(model, _result(params), tmp_path / "calibrated.xml")
+
+        root = ET.parse(out).getroot()
+        first, second = root.iter("joint")
+        assert first.get("damping") == "0.3"
+        assert first.get("armature") == "0.02"
+        assert second.get("damping") is None
+        assert root.find(".//inertial").get("mass") == "5.0"
+        assert root.find(".//geom").get("friction") == "1.2 0.01 0.001"
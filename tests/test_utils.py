@@ -0,0 +1,25 @@
+"""
+Tests for luckyrobots.utils config helpers.
+"""
+
+import pytest
+
+from luckyrobots.utils import get_robot_config, validate_params
+
+
+class TestGetRobotConfig:
+    """Tests for the cached robots.yaml loader."""
+
+    def test_returns_independent_copies(self):
+        """Test mutating a returned config does not leak into later calls."""
+        first = get_robot_config("unitreego2")
+        first["available_scenes"].append("not-a-scene")
+
+        second = get_robot_config("unitreego2")
+
+        assert "not-a-scene" not in second["available_scenes"]
+
+    def test_validate_params_uses_config(self):
+        """Test validation rejects values missing from the robot config."""
+        with pytest.raises(ValueError, match="Scene"):
+            validate_params("not-a-scene", "unitreego2", "locomotion", "pixels_with_state")